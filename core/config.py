@@ -95,6 +95,13 @@ class Settings(BaseSettings):
 
     WS_BACKEND: str = "redis"
 
+    SEARCH_BACKEND: str = "mysql"
+    MEILISEARCH_URL: str = ""
+    MEILISEARCH_API_KEY: str = ""
+
+    LIKE_CACHE_BACKEND: str = "none"
+    USER_CACHE_BACKEND: str = "none"
+
     model_config = SettingsConfigDict(env_file=str(_ENV_FILE), env_file_encoding="utf-8", extra="ignore")
 
 
@@ -7,19 +7,28 @@ import logging
 import time
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
 
 import aiomysql
 
 from core.config import settings
+from core.utils.clock import utc_now
 
 # 이 임계값(초)을 초과하는 쿼리는 WARNING으로 기록
 _SLOW_QUERY_THRESHOLD = 0.5
 
+# 이 시간(초)보다 오래된 풀 연결은 획득 시 재연결 — 서버 wait_timeout/프록시 유휴 종료로
+# 끊긴 연결을 요청 경로에서 처음 쓰다가 실패하지 않도록 함
+_POOL_RECYCLE_SECONDS = 3600
+
 logger = logging.getLogger(__name__)
 
 # 전역 연결 풀
 _pool: aiomysql.Pool | None = None
 
+# DB 세션 시간대의 UTC 오프셋 (init_db에서 측정) — db_timestamp()가 NOW()와 같은 값을 만들 때 사용
+_db_utc_offset = timedelta(0)
+
 
 async def init_db() -> None:
     """데이터베이스 연결 풀을 초기화합니다.
@@ -30,7 +39,7 @@ async def init_db() -> None:
     - READ COMMITTED: Dirty Read 방지, REPEATABLE READ보다 가벼움
     - 웹 애플리케이션에 적합한 수준
     """
-    global _pool
+    global _pool, _db_utc_offset
     try:
         _pool = await aiomysql.create_pool(
             host=settings.DB_HOST,
@@ -43,12 +52,17 @@ async def init_db() -> None:
             minsize=5,
             maxsize=50,
             connect_timeout=5,  # 5초 연결 타임아웃
+            pool_recycle=_POOL_RECYCLE_SECONDS,
             # 트랜잭션 격리 수준 설정
             init_command="SET SESSION TRANSACTION ISOLATION LEVEL READ COMMITTED",
         )
+        async with _pool.acquire() as conn, conn.cursor() as cur:
+            await cur.execute("SELECT TIMESTAMPDIFF(SECOND, UTC_TIMESTAMP(), NOW())")
+            (offset_seconds,) = await cur.fetchone()
+        _db_utc_offset = timedelta(seconds=offset_seconds)
         logger.info(
             f"MySQL 연결 풀 초기화 완료: {settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME} "
-            f"(격리 수준: READ COMMITTED, 풀 크기: 5-50)"
+            f"(격리 수준: READ COMMITTED, 풀 크기: 5-50, 재연결 주기: {_POOL_RECYCLE_SECONDS}s)"
         )
     except Exception as e:
         logger.error(f"MySQL 연결 풀 초기화 실패: {e}")
@@ -65,6 +79,15 @@ async def close_db() -> None:
         logger.info("MySQL 연결 풀 종료")
 
 
+def db_timestamp() -> datetime:
+    """DB의 NOW()가 지금 반환할 값(naive, 초 단위)을 계산합니다.
+
+    INSERT/UPDATE 직후 재조회 없이 기본값(CURRENT_TIMESTAMP) 컬럼 값을 채우거나, 같은 값을 명시적으로
+    기록할 때 사용합니다. 세션 시간대를 바꾸지 않으므로 오프셋은 시작 시 한 번 측정한 값을 씁니다.
+    """
+    return (utc_now() + _db_utc_offset).replace(tzinfo=None, microsecond=0)
+
+
 def get_pool() -> aiomysql.Pool:
     """현재 연결 풀을 반환합니다. 초기화되지 않은 경우 RuntimeError."""
     if _pool is None:
@@ -75,13 +98,13 @@ def get_pool() -> aiomysql.Pool:
 class _TimedCursor:
     """쿼리 실행 시간을 측정하고 슬로우 쿼리를 로깅하는 커서 래퍼.
 
-    aiomysql.DictCursor의 모든 속성에 대한 투명 프록시로 동작하며,
+    aiomysql 커서(DictCursor/Cursor)의 모든 속성에 대한 투명 프록시로 동작하며,
     execute()와 executemany()만 감싸서 타이밍을 측정합니다.
     """
 
     __slots__ = ("_cur",)
 
-    def __init__(self, cur: aiomysql.DictCursor) -> None:
+    def __init__(self, cur: aiomysql.Cursor) -> None:
         self._cur = cur
 
     async def execute(self, query: str, args=None):
@@ -118,15 +141,25 @@ class _TimedCursor:
 
 
 @asynccontextmanager
-async def _acquire_dict_cursor() -> AsyncGenerator[tuple[aiomysql.Connection, aiomysql.DictCursor]]:
-    """풀에서 연결을 획득하고 DictCursor를 여는 내부 헬퍼.
+async def _acquire_cursor(
+    cursor_class: type[aiomysql.Cursor] = aiomysql.DictCursor,
+) -> AsyncGenerator[tuple[aiomysql.Connection, aiomysql.Cursor]]:
+    """풀에서 연결을 획득하고 커서를 여는 내부 헬퍼.
 
     get_cursor()와 transactional()이 공유하여 중복을 제거합니다.
     슬로우 쿼리 감지를 위해 _TimedCursor로 래핑합니다.
+    커서는 획득마다 conn.cursor()로 열어 연결 상태 확인과 pool_recycle용 사용 시각 갱신을 거치고,
+    반환 전 닫아 남은 결과셋을 소진합니다.
     """
     pool = get_pool()
-    async with pool.acquire() as conn, conn.cursor(aiomysql.DictCursor) as cur:
-        yield conn, _TimedCursor(cur)  # type: ignore[misc]
+    # 쿼리가 끝나면 바로 풀에 반환 — 연결을 쥔 채 다른 연결을 기다리지 않으므로
+    # 요청 안의 asyncio.gather가 풀 크기만큼 몰려도 교착되지 않음
+    async with pool.acquire() as conn:
+        cur = await conn.cursor(cursor_class)
+        try:
+            yield conn, _TimedCursor(cur)  # type: ignore[misc]
+        finally:
+            await cur.close()
 
 
 @asynccontextmanager
@@ -137,17 +170,28 @@ async def get_connection() -> AsyncGenerator[aiomysql.Connection]:
         yield conn
 
 
+def _cursor_class(as_tuple: bool) -> type[aiomysql.Cursor]:
+    # 행 수가 많은 핫 패스는 튜플 커서로 행마다 dict를 만드는 비용을 피함
+    return aiomysql.Cursor if as_tuple else aiomysql.DictCursor
+
+
 @asynccontextmanager
-async def get_cursor() -> AsyncGenerator[aiomysql.DictCursor]:
-    """DictCursor를 컨텍스트 매니저로 제공합니다. (읽기 전용 쿼리용)"""
-    async with _acquire_dict_cursor() as (_conn, cur):
-        yield cur
+async def get_cursor(*, as_tuple: bool = False) -> AsyncGenerator[aiomysql.DictCursor]:
+    """DictCursor를 컨텍스트 매니저로 제공합니다. (읽기 전용 쿼리용)
+
+    as_tuple=True이면 행을 SELECT 컬럼 순서의 튜플로 반환하는 기본 Cursor를 제공합니다.
+    """
+    async with _acquire_cursor(_cursor_class(as_tuple)) as (_conn, cur):
+        yield cur  # type: ignore[misc]
 
 
 @asynccontextmanager
-async def transactional() -> AsyncGenerator[aiomysql.DictCursor]:
-    """트랜잭션 컨텍스트 매니저. 예외 시 롤백, 정상 종료 시 커밋. DictCursor 반환."""
-    async with _acquire_dict_cursor() as (conn, cur):
+async def transactional(*, as_tuple: bool = False) -> AsyncGenerator[aiomysql.DictCursor]:
+    """트랜잭션 컨텍스트 매니저. 예외 시 롤백, 정상 종료 시 커밋. DictCursor 반환.
+
+    as_tuple=True이면 튜플 행을 반환하는 기본 Cursor를 제공합니다.
+    """
+    async with _acquire_cursor(_cursor_class(as_tuple)) as (conn, cur):
         try:
             await conn.begin()
             yield cur
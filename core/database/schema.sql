@@ -70,9 +70,12 @@ CREATE TABLE IF NOT EXISTS post (
     is_pinned TINYINT(1) NOT NULL DEFAULT 0,
     views INT UNSIGNED DEFAULT 0,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    -- ON UPDATE 미사용: 조회수/고정 변경에는 갱신하지 않고, 제목/내용 수정 시에만 NOW()로 기록
     updated_at TIMESTAMP NULL,
     deleted_at TIMESTAMP NULL,
     accepted_answer_id INT UNSIGNED NULL,
+    -- 전문 검색 대상: 삭제된 게시글은 빈 문자열 (FULLTEXT 부분 인덱스 대용)
+    search_body TEXT GENERATED ALWAYS AS (IF(deleted_at IS NULL, CONCAT_WS(' ', title, content), '')) STORED,
     FOREIGN KEY (author_id) REFERENCES user (id) ON DELETE SET NULL,
     FOREIGN KEY (category_id) REFERENCES category (id) ON DELETE SET NULL
 );
@@ -324,6 +327,7 @@ CREATE TABLE IF NOT EXISTS post_tag (
     -- 1. 인증/리프레시 토큰 (크리티컬)
     CREATE INDEX idx_refresh_token_hash ON refresh_token (token_hash);
     CREATE INDEX idx_refresh_token_user_id ON refresh_token (user_id);
+    CREATE INDEX idx_refresh_token_expires ON refresh_token (expires_at);
     
     -- 2. 사용자/게시글/댓글 (Soft Delete 필터링)
     CREATE INDEX idx_user_deleted_at ON user (deleted_at);
@@ -341,8 +345,8 @@ CREATE TABLE IF NOT EXISTS post_tag (
     -- 6. 대댓글 조회 최적화
     CREATE INDEX idx_comment_parent_id ON comment (parent_id);
 
-    -- 7. 게시글 제목+내용 전문 검색 (한국어 ngram)
-    ALTER TABLE post ADD FULLTEXT INDEX ft_post_search (title, content) WITH PARSER ngram;
+    -- 7. 게시글 제목+내용 전문 검색 (한국어 ngram, 삭제 글 제외된 search_body)
+    ALTER TABLE post ADD FULLTEXT INDEX ft_post_search_body (search_body) WITH PARSER ngram;
 
     -- 8. 이메일 인증 토큰 조회
     CREATE INDEX idx_email_verification_token ON email_verification (token_hash);
@@ -363,8 +367,9 @@ CREATE TABLE IF NOT EXISTS post_tag (
     -- 13. 고정 게시글 조회
     CREATE INDEX idx_post_pinned ON post (is_pinned, deleted_at, created_at DESC);
 
-    -- 14. 신고 상태별 조회
+    -- 14. 신고 상태별 조회 (상태 필터 없는 전체 목록은 created_at 단독 인덱스로 정렬)
     CREATE INDEX idx_report_status ON report (status, created_at DESC);
+    CREATE INDEX idx_report_created ON report (created_at DESC);
 
     -- 15. 신고 대상별 조회
     CREATE INDEX idx_report_target ON report (target_type, target_id, status);
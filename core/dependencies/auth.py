@@ -4,14 +4,13 @@ JWT Bearer Token 기반 사용자 인증 및 권한 확인 기능을 제공합
 """
 
 import hmac
-from datetime import UTC, datetime
 
 from fastapi import Depends, HTTPException, Request, status
 
 from core.config import settings
 from core.dependencies.request_context import get_request_timestamp
 from core.utils.jwt_utils import decode_access_token
-from modules.user import models as user_models
+from modules.user.loader import get_user_loader
 from modules.user.models import User
 
 
@@ -44,14 +43,14 @@ async def _validate_token(request: Request) -> User | None:
     payload = decode_access_token(raw_token)
 
     user_id = int(payload["sub"])
-    user = await user_models.get_user_by_id(user_id)
+    user = await get_user_loader(request).load(user_id)
 
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail={
                 "error": "unauthorized",
-                "timestamp": datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "timestamp": get_request_timestamp(request),
             },
         )
 
@@ -66,7 +65,7 @@ async def _validate_token(request: Request) -> User | None:
                     user.suspended_until.strftime("%Y-%m-%dT%H:%M:%SZ") if user.suspended_until else None
                 ),
                 "suspended_reason": user.suspended_reason,
-                "timestamp": datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "timestamp": get_request_timestamp(request),
             },
         )
 
@@ -92,7 +91,7 @@ async def get_current_user(request: Request) -> User:
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail={
                 "error": "unauthorized",
-                "timestamp": datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "timestamp": get_request_timestamp(request),
             },
         )
 
@@ -3,10 +3,10 @@
 미들웨어에서 설정한 요청 정보에 대한 접근을 제공합니다.
 """
 
-from datetime import UTC, datetime
-
 from fastapi import Request
 
+from core.utils.clock import utc_timestamp
+
 
 def get_request_timestamp(request: Request) -> str:
     """요청 타임스탬프를 ISO 8601 형식 문자열로 반환합니다.
@@ -23,4 +23,4 @@ def get_request_timestamp(request: Request) -> str:
     if hasattr(request.state, "request_time"):
         return request.state.request_time.strftime("%Y-%m-%dT%H:%M:%SZ")
     # 미들웨어가 설정되지 않은 경우 폴백
-    return datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return utc_timestamp()
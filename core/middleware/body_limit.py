@@ -4,34 +4,56 @@ K8s 환경에서 nginx 없이 직접 노출되는 API Pod의 DoS 방지를 위
 요청 본문 크기를 제한합니다.
 """
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from fastapi import HTTPException
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
-class BodyLimitMiddleware(BaseHTTPMiddleware):
-    """요청 본문 크기 제한 미들웨어.
+class BodyLimitMiddleware:
+    """요청 본문 크기 제한 미들웨어 (순수 ASGI).
 
-    Content-Length 헤더를 검사하여 제한 초과 시 413을 반환합니다.
+    Content-Length 헤더가 제한을 넘으면 본문을 읽기 전에 413을 반환합니다.
+    Content-Length가 없는 스트리밍(chunked) 본문은 수신한 바이트를 세어, 제한을 넘는 순간
+    본문 파싱을 413 HTTPException으로 중단합니다 — 멀티파트 업로드가 디스크로 끝까지 스풀되지 않음.
 
     Args:
         max_body_size: 최대 본문 크기 (바이트). 기본값 10MB.
     """
 
-    def __init__(self, app, max_body_size: int = 10 * 1024 * 1024) -> None:
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, max_body_size: int = 10 * 1024 * 1024) -> None:
+        self.app = app
         self.max_body_size = max_body_size
 
-    async def dispatch(self, request: Request, call_next) -> Response:
-        content_length = request.headers.get("content-length")
-        if content_length and int(content_length) > self.max_body_size:
-            return JSONResponse(
-                status_code=413,
-                content={
-                    "detail": {
-                        "code": "PAYLOAD_TOO_LARGE",
-                        "message": f"요청 본문이 {self.max_body_size // (1024 * 1024)}MB 제한을 초과합니다.",
-                    }
-                },
-            )
-        return await call_next(request)
+    def _detail(self) -> dict[str, str]:
+        return {
+            "code": "PAYLOAD_TOO_LARGE",
+            "message": f"요청 본문이 {self.max_body_size // (1024 * 1024)}MB 제한을 초과합니다.",
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        content_length = Headers(scope=scope).get("content-length")
+        if content_length is not None:
+            if int(content_length) > self.max_body_size:
+                response = JSONResponse(status_code=413, content={"detail": self._detail()})
+                await response(scope, receive, send)
+                return
+            await self.app(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_size:
+                    raise HTTPException(status_code=413, detail=self._detail())
+            return message
+
+        await self.app(scope, limited_receive, send)
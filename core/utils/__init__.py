@@ -5,5 +5,7 @@ Modules:
     upload: 파일 업로드 디스패처
     storage: 로컬 파일 저장소
     formatters: 날짜/시간 포맷팅
+    clock: 현재 UTC 시각 및 응답 타임스탬프 문자열 캐시
+    json_response: pydantic-core 기반 JSON 응답 클래스
     exceptions: HTTP 에러 헬퍼
 """
@@ -0,0 +1,30 @@
+"""clock: 현재 UTC 시각 캐시 유틸리티 모듈.
+
+인증 경로처럼 요청마다 만료 시각을 비교하는 곳에서 datetime.now(UTC)를 반복 호출하지 않도록
+1ms 단위로 같은 값을 재사용합니다. 만료 판정에는 1ms 오차가 의미 없습니다.
+응답 타임스탬프 문자열은 초 단위 형식이므로 같은 초 안에서는 strftime 결과를 재사용합니다.
+"""
+
+import time
+from datetime import UTC, datetime
+
+_cached: tuple[int, datetime] = (-1, datetime.min.replace(tzinfo=UTC))
+_cached_timestamp: tuple[int, str] = (-1, "")
+
+
+def utc_now() -> datetime:
+    """현재 UTC 시각(timezone-aware)을 반환합니다. 같은 1ms 구간에서는 캐시된 값을 반환합니다."""
+    global _cached
+    bucket = time.monotonic_ns() // 1_000_000
+    if _cached[0] != bucket:
+        _cached = (bucket, datetime.now(UTC))
+    return _cached[1]
+
+
+def utc_timestamp() -> str:
+    """현재 UTC 시각을 응답용 ISO 8601 문자열(예: 2026-01-01T00:00:00Z)로 반환합니다."""
+    global _cached_timestamp
+    second = int(time.time())
+    if _cached_timestamp[0] != second:
+        _cached_timestamp = (second, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(second)))
+    return _cached_timestamp[1]
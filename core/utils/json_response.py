@@ -0,0 +1,21 @@
+"""json_response: pydantic-core 기반 JSON 응답 클래스 모듈.
+
+라우트는 response_model 없이 dict를 반환하므로 FastAPI가 jsonable_encoder 후 응답 클래스로
+직렬화합니다. 기본 JSONResponse의 표준 json.dumps 대신 이미 의존성에 포함된 pydantic-core의
+Rust 인코더로 같은 바이트(UTF-8, 공백 없음)를 만듭니다.
+"""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class FastJSONResponse(JSONResponse):
+    """pydantic-core로 렌더링하는 JSONResponse.
+
+    NaN/Infinity는 표준 JSON에 없으므로 null로 직렬화합니다.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content, inf_nan_mode="null")
@@ -0,0 +1,164 @@
+"""like_bitmap: 게시글 좋아요 여부를 Redis 비트맵으로 캐싱합니다.
+
+LIKE_CACHE_BACKEND=redis일 때만 동작하며, 기본값(none)에서는 모든 함수가 no-op입니다.
+게시글마다 `post:likers:{post_id}` 비트맵에 좋아요한 user_id 비트를 세워 두고,
+상세 조회 시 "내가 좋아요했는지"를 MySQL 대신 GETBIT 한 번으로 판정합니다.
+
+비트 0은 적재 완료 표식입니다 (user_id는 1부터 시작). 표식이 없는 비트맵은
+미적재로 간주하여 None을 반환하고, 호출자가 MySQL로 폴백합니다.
+
+적재는 claim_warmup → MySQL 좋아요 목록 조회 → warm 순서로 진행되며, 그 사이의 좋아요/취소는
+미적재 비트맵에 반영할 수 없습니다. 그래서 mark()는 `post:likers:{post_id}:version`을 올리고,
+warm()은 claim_warmup 시점의 버전이 그대로일 때만 적재합니다 — 버전이 바뀌었으면 조회한 목록이
+낡았을 수 있으므로 적재를 포기하고 다음 미스에서 다시 적재합니다.
+모든 Redis 오류는 best-effort — 예외를 전파하지 않습니다.
+"""
+
+import logging
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 적재 후 만료 시간 — 유실된 SETBIT 등으로 인한 불일치를 이 시간 안으로 제한
+BITMAP_TTL_SECONDS = 600
+
+# 동시 미스 시 한 요청만 적재하도록 거는 락의 만료 시간
+_WARMUP_LOCK_SECONDS = 30
+
+# 적재 표식이 있을 때만 비트를 읽음 (-1: 미적재)
+_LOOKUP_SCRIPT = """
+if redis.call('GETBIT', KEYS[1], 0) == 0 then return -1 end
+return redis.call('GETBIT', KEYS[1], ARGV[1])
+"""
+
+# 버전을 올려 진행 중인 적재를 무효화하고, 적재 표식이 있을 때만 비트를 갱신
+# (미적재 키를 부분 비트맵으로 만들지 않음)
+_MARK_SCRIPT = """
+redis.call('INCR', KEYS[2])
+redis.call('EXPIRE', KEYS[2], ARGV[3])
+if redis.call('GETBIT', KEYS[1], 0) == 0 then return -1 end
+return redis.call('SETBIT', KEYS[1], ARGV[1], ARGV[2])
+"""
+
+# 적재 락 획득 후의 버전을 함께 반환 (락을 얻지 못하면 -1)
+_CLAIM_SCRIPT = """
+if not redis.call('SET', KEYS[1], 1, 'NX', 'EX', ARGV[1]) then return -1 end
+return tonumber(redis.call('GET', KEYS[2]) or '0')
+"""
+
+# claim_warmup 이후 버전이 그대로일 때만 적재 (ARGV: 버전, TTL, user_id...) — 어느 쪽이든 락 해제
+_WARM_SCRIPT = """
+redis.call('DEL', KEYS[3])
+if tonumber(redis.call('GET', KEYS[2]) or '0') ~= tonumber(ARGV[1]) then return 0 end
+for i = 3, #ARGV do
+    redis.call('SETBIT', KEYS[1], ARGV[i], 1)
+end
+redis.call('SETBIT', KEYS[1], 0, 1)
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+
+
+def is_enabled() -> bool:
+    """좋아요 비트맵 캐시 사용 여부."""
+    return settings.LIKE_CACHE_BACKEND == "redis" and bool(settings.REDIS_URL)
+
+
+def _key(post_id: int) -> str:
+    return f"post:likers:{post_id}"
+
+
+def _version_key(post_id: int) -> str:
+    return f"post:likers:{post_id}:version"
+
+
+def _warming_key(post_id: int) -> str:
+    return f"post:likers:{post_id}:warming"
+
+
+async def _redis():
+    from core.utils.redis_client import get_redis
+
+    return await get_redis(settings.REDIS_URL)
+
+
+async def is_liked(post_id: int, user_id: int) -> bool | None:
+    """사용자의 게시글 좋아요 여부를 비트맵에서 조회합니다.
+
+    Returns:
+        좋아요 여부. 비활성화, 미적재, Redis 오류 시 None.
+    """
+    if not is_enabled():
+        return None
+    try:
+        redis = await _redis()
+        bit = await redis.eval(_LOOKUP_SCRIPT, 1, _key(post_id), user_id)
+    except Exception:
+        logger.warning("좋아요 비트맵 조회 실패 (post_id=%d, best-effort)", post_id, exc_info=True)
+        return None
+    if bit == -1:
+        return None
+    return bit == 1
+
+
+async def mark(post_id: int, user_id: int, liked: bool) -> None:
+    """좋아요 추가/취소를 적재된 비트맵에 반영하고, 진행 중인 적재를 무효화합니다 (best-effort).
+
+    DB 커밋 이후에 호출해야 합니다.
+    """
+    if not is_enabled():
+        return
+    try:
+        redis = await _redis()
+        await redis.eval(
+            _MARK_SCRIPT,
+            2,
+            _key(post_id),
+            _version_key(post_id),
+            user_id,
+            1 if liked else 0,
+            _WARMUP_LOCK_SECONDS,
+        )
+    except Exception:
+        logger.warning("좋아요 비트맵 갱신 실패 (post_id=%d, best-effort)", post_id, exc_info=True)
+
+
+async def claim_warmup(post_id: int) -> int | None:
+    """비트맵 적재 권한을 획득합니다. 획득한 요청만 좋아요 목록을 읽어 적재합니다.
+
+    Returns:
+        획득 시점의 버전 (warm에 그대로 전달). 획득하지 못했거나 비활성화, Redis 오류 시 None.
+    """
+    if not is_enabled():
+        return None
+    try:
+        redis = await _redis()
+        version = await redis.eval(_CLAIM_SCRIPT, 2, _warming_key(post_id), _version_key(post_id), _WARMUP_LOCK_SECONDS)
+    except Exception:
+        logger.warning("좋아요 비트맵 적재 락 실패 (post_id=%d, best-effort)", post_id, exc_info=True)
+        return None
+    return None if version == -1 else version
+
+
+async def warm(post_id: int, user_ids: list[int], version: int) -> None:
+    """게시글의 좋아요 사용자 목록으로 비트맵을 적재하고 적재 표식을 세웁니다 (best-effort).
+
+    claim_warmup 이후 좋아요/취소가 있었으면(버전 변경) 목록이 낡았을 수 있으므로 적재하지 않습니다.
+    """
+    if not is_enabled():
+        return
+    try:
+        redis = await _redis()
+        await redis.eval(
+            _WARM_SCRIPT,
+            3,
+            _key(post_id),
+            _version_key(post_id),
+            _warming_key(post_id),
+            version,
+            BITMAP_TTL_SECONDS,
+            *user_ids,
+        )
+    except Exception:
+        logger.warning("좋아요 비트맵 적재 실패 (post_id=%d, best-effort)", post_id, exc_info=True)
@@ -1,5 +1,8 @@
 """pagination: 페이지네이션 파라미터 검증 및 SQL 유틸리티."""
 
+import base64
+from datetime import datetime
+
 from fastapi import HTTPException, status
 
 
@@ -20,3 +23,23 @@ def validate_pagination(offset: int, limit: int, timestamp: str) -> None:
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={"error": "invalid_limit", "message": "limit은 1~100 사이여야 합니다.", "timestamp": timestamp},
         )
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """keyset 페이지네이션용 (created_at, id) 커서를 불투명 문자열로 인코딩."""
+    raw = f"{created_at.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, timestamp: str) -> tuple[datetime, int]:
+    """encode_cursor()로 만든 커서를 (created_at, id)로 복원. 형식이 잘못되면 400 에러."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        created_at_str, row_id_str = raw.split("|", 1)
+        return datetime.fromisoformat(created_at_str), int(row_id_str)
+    except ValueError:  # binascii.Error, UnicodeDecodeError 포함
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"error": "invalid_cursor", "message": "유효하지 않은 커서입니다.", "timestamp": timestamp},
+        ) from None
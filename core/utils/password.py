@@ -1,8 +1,13 @@
 """password: 비밀번호 해싱 및 검증 유틸리티 모듈.
 
 bcrypt를 사용하여 비밀번호를 안전하게 해싱하고 검증합니다.
+요청 경로에서는 이벤트 루프를 막지 않도록 *_async 함수를 사용합니다.
 """
 
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import bcrypt
 
 from core.config import settings
@@ -10,6 +15,10 @@ from core.config import settings
 # 테스트 환경에서는 최소 라운드로 해싱 (rounds 12 → 4, ~250배 빠름)
 _BCRYPT_ROUNDS = 4 if settings.TESTING else 12
 
+# bcrypt 전용 스레드 풀 (CPU 코어 수) — 로그인/가입 폭주 시 해싱이 asyncio.to_thread의
+# 기본 스레드 풀(이미지 검증/리사이즈, 파일 쓰기)을 점유하지 않도록 분리. bcrypt는 해싱 중 GIL을 해제함
+_PASSWORD_EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="password")
+
 
 def hash_password(password: str) -> str:
     """비밀번호를 해싱합니다.
@@ -46,3 +55,15 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return bcrypt.checkpw(password_bytes, hashed_bytes)
     except Exception:
         return False
+
+
+async def hash_password_async(password: str) -> str:
+    """hash_password를 비밀번호 전용 스레드 풀에서 실행합니다."""
+    return await asyncio.get_running_loop().run_in_executor(_PASSWORD_EXECUTOR, hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password를 비밀번호 전용 스레드 풀에서 실행합니다."""
+    return await asyncio.get_running_loop().run_in_executor(
+        _PASSWORD_EXECUTOR, verify_password, plain_password, hashed_password
+    )
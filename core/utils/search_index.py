@@ -0,0 +1,181 @@
+"""search_index: 외부 검색 엔진(Meilisearch) 게시글 색인 및 검색.
+
+SEARCH_BACKEND=meilisearch일 때만 동작하며, 기본값(mysql)에서는 모든 함수가 no-op입니다.
+색인/삭제는 best-effort — 실패해도 예외를 전파하지 않습니다.
+검색 실패 시, 또는 매칭 건수가 MAX_SEARCH_HITS에 닿아 후보가 잘렸을 수 있을 때 None을 반환하여
+호출자가 MySQL FULLTEXT로 폴백하도록 합니다.
+
+HTTP 클라이언트는 프로세스당 하나를 재사용합니다 (앱 시작 시 init_search_index, 종료 시 close_search_index).
+요청 경로의 색인 쓰기는 enqueue_index_post/enqueue_remove_post로 백그라운드 워커에 넘겨
+게시글 생성/수정/삭제 응답이 검색 엔진 왕복을 기다리지 않도록 합니다. 워커는 큐 순서대로 하나씩
+전송하므로 같은 게시글의 생성→수정→삭제 순서가 유지됩니다. 큐가 가득 차거나 전송에 실패해 빠진 색인은
+scripts/reindex_search.py로 다시 채웁니다.
+"""
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Awaitable, Callable
+from functools import partial
+
+import httpx
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+POST_INDEX = "posts"
+
+# 검색 엔진에서 가져오는 최대 후보 수 — 이후 필터/정렬/페이지네이션은 MySQL이 처리
+# 매칭이 이 수에 닿으면 총 개수/페이지가 잘리지 않도록 FULLTEXT로 폴백 (Meilisearch 기본 maxTotalHits와 같음)
+MAX_SEARCH_HITS = 1000
+
+# 전송 대기 중인 색인 쓰기 상한 — 검색 엔진 장애 시 메모리가 무한히 늘지 않도록 초과분은 버림
+_WRITE_QUEUE_SIZE = 10000
+
+# 종료 시 남은 색인 쓰기를 기다리는 최대 시간(초)
+_SHUTDOWN_DRAIN_SECONDS = 5.0
+
+_TIMEOUT = httpx.Timeout(2.0)
+
+_client: httpx.AsyncClient | None = None
+_write_queue: asyncio.Queue[Callable[[], Awaitable[None]]] | None = None
+_writer: asyncio.Task[None] | None = None
+
+
+def is_enabled() -> bool:
+    """외부 검색 엔진 사용 여부."""
+    return settings.SEARCH_BACKEND == "meilisearch" and bool(settings.MEILISEARCH_URL)
+
+
+def _headers() -> dict[str, str]:
+    if settings.MEILISEARCH_API_KEY:
+        return {"Authorization": f"Bearer {settings.MEILISEARCH_API_KEY}"}
+    return {}
+
+
+def _get_client() -> httpx.AsyncClient:
+    """공유 HTTP 클라이언트를 반환합니다. 아직 없으면 만듭니다 (lifespan 밖의 스크립트/테스트용)."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            base_url=f"{settings.MEILISEARCH_URL.rstrip('/')}/indexes/{POST_INDEX}",
+            headers=_headers(),
+            timeout=_TIMEOUT,
+        )
+    return _client
+
+
+async def init_search_index() -> None:
+    """공유 HTTP 클라이언트와 색인 쓰기 워커를 시작합니다 (앱 시작 시 호출)."""
+    if not is_enabled():
+        return
+    _get_client()
+    _start_writer()
+
+
+async def close_search_index() -> None:
+    """남은 색인 쓰기를 잠시 기다린 뒤 워커와 HTTP 클라이언트를 정리합니다 (앱 종료 시 호출)."""
+    global _client, _write_queue, _writer
+    if _write_queue is not None:
+        try:
+            await asyncio.wait_for(_write_queue.join(), timeout=_SHUTDOWN_DRAIN_SECONDS)
+        except TimeoutError:
+            logger.warning("종료 시 미전송 색인 쓰기 %d건을 버림", _write_queue.qsize())
+    if _writer is not None:
+        _writer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _writer
+    _write_queue = None
+    _writer = None
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def _start_writer() -> asyncio.Queue[Callable[[], Awaitable[None]]]:
+    global _write_queue, _writer
+    if _write_queue is None or _writer is None or _writer.done():
+        _write_queue = asyncio.Queue(maxsize=_WRITE_QUEUE_SIZE)
+        _writer = asyncio.create_task(_drain_writes(_write_queue))
+    return _write_queue
+
+
+async def _drain_writes(queue: asyncio.Queue[Callable[[], Awaitable[None]]]) -> None:
+    while True:
+        write = await queue.get()
+        try:
+            await write()
+        finally:
+            queue.task_done()
+
+
+def _enqueue(write: Callable[[], Awaitable[None]], post_id: int) -> None:
+    if not is_enabled():
+        return
+    try:
+        _start_writer().put_nowait(write)
+    except asyncio.QueueFull:
+        logger.warning("색인 쓰기 큐가 가득 차 건너뜀 (post_id=%d, 재색인 필요)", post_id)
+
+
+def enqueue_index_post(post_id: int, title: str, content: str) -> None:
+    """게시글 색인을 백그라운드 워커에 넘깁니다 (요청 경로용, 기다리지 않음)."""
+    _enqueue(partial(index_post, post_id, title, content), post_id)
+
+
+def enqueue_remove_post(post_id: int) -> None:
+    """게시글 색인 제거를 백그라운드 워커에 넘깁니다 (요청 경로용, 기다리지 않음)."""
+    _enqueue(partial(remove_post, post_id), post_id)
+
+
+async def index_posts(documents: list[dict]) -> None:
+    """게시글 문서({"id", "title", "content"})를 한 번에 색인합니다. 실패 시 예외를 전파합니다 (재색인용)."""
+    resp = await _get_client().post("/documents", params={"primaryKey": "id"}, json=documents)
+    resp.raise_for_status()
+
+
+async def index_post(post_id: int, title: str, content: str) -> None:
+    """게시글을 색인합니다 (생성/수정 공용, best-effort)."""
+    if not is_enabled():
+        return
+    try:
+        await index_posts([{"id": post_id, "title": title, "content": content}])
+    except Exception:
+        logger.warning("게시글 색인 실패 (post_id=%d, best-effort)", post_id, exc_info=True)
+
+
+async def remove_post(post_id: int) -> None:
+    """게시글을 색인에서 제거합니다 (best-effort)."""
+    if not is_enabled():
+        return
+    try:
+        resp = await _get_client().delete(f"/documents/{post_id}")
+        resp.raise_for_status()
+    except Exception:
+        logger.warning("게시글 색인 제거 실패 (post_id=%d, best-effort)", post_id, exc_info=True)
+
+
+async def search_post_ids(query: str) -> list[int] | None:
+    """검색어에 매칭되는 게시글 ID를 반환합니다.
+
+    Returns:
+        게시글 ID 목록 (MAX_SEARCH_HITS개 미만). 비활성화, 실패 또는 매칭이 MAX_SEARCH_HITS에 닿으면 None.
+    """
+    if not is_enabled():
+        return None
+    try:
+        resp = await _get_client().post(
+            "/search",
+            json={"q": query, "limit": MAX_SEARCH_HITS, "attributesToRetrieve": ["id"]},
+        )
+        resp.raise_for_status()
+        result = resp.json()
+        hits = result.get("hits", [])
+        if len(hits) >= MAX_SEARCH_HITS or result.get("estimatedTotalHits", 0) >= MAX_SEARCH_HITS:
+            logger.info("외부 검색 매칭이 %d건 이상, MySQL FULLTEXT로 폴백", MAX_SEARCH_HITS)
+            return None
+        return [int(hit["id"]) for hit in hits]
+    except Exception:
+        logger.warning("외부 검색 실패, MySQL FULLTEXT로 폴백", exc_info=True)
+        return None
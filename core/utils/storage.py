@@ -85,8 +85,8 @@ async def save_uploaded_file(file: UploadFile, folder: str = "images") -> str:
             },
         )
 
-    # 4. Read file content
-    content = await file.read()
+    # 4. Read file content — 한도를 1바이트 넘게만 읽어 초과 여부를 판단 (큰 업로드 전체를 메모리에 올리지 않음)
+    content = await file.read(MAX_IMAGE_SIZE + 1)
 
     # 5. Validate not empty
     if not content:
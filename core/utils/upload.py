@@ -29,3 +29,17 @@ async def save_file(file: UploadFile, folder: str = "images") -> str:
     from core.utils.storage import save_uploaded_file
 
     return await save_uploaded_file(file, folder=folder)
+
+
+def warm_up() -> None:
+    """업로드 경로의 지연 import(Pillow)와 S3 클라이언트 생성을 미리 수행합니다.
+
+    앱 시작 시 호출하여 첫 이미지 업로드 요청이 모듈 로드/클라이언트 생성 비용을 떠안지 않도록 합니다.
+    """
+    # S3 백엔드도 검증 상수/함수를 storage에서 가져오므로 두 백엔드 모두 미리 로드
+    from core.utils import image_resize, storage  # noqa: F401
+
+    if _STORAGE_BACKEND == "s3":
+        from core.utils.storage_s3 import _get_s3_client
+
+        _get_s3_client()
@@ -3,6 +3,7 @@
 애플리케이션 설정, 미들웨어 구성, 라우터 등록, 전역 예외 핸들러를 설정합니다.
 """
 
+import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
@@ -22,6 +23,8 @@ from core.middleware.exception_handler import (
     request_validation_exception_handler,
 )
 from core.middleware.request_id import RequestIdMiddleware
+from core.utils import search_index, upload
+from core.utils.json_response import FastJSONResponse
 from modules.admin.router import report_router
 from modules.auth.router import auth_router
 from modules.auth.social_router import router as social_auth_router
@@ -53,11 +56,15 @@ async def lifespan(app: FastAPI):
     배치 작업(토큰 정리, 피드 점수 재계산)은 K8s CronJob으로 실행됩니다.
     """
     await init_db()
+    await search_index.init_search_index()
+    # 업로드 경로의 지연 import(Pillow, boto3)를 첫 요청 전에 수행
+    await asyncio.to_thread(upload.warm_up)
     yield
     # Redis 연결 종료 (레이트리밋, WebSocket pusher가 사용)
     from core.utils.redis_client import close_redis
 
     await close_redis()
+    await search_index.close_search_index()
     await close_db()
 
 
@@ -66,6 +73,8 @@ app = FastAPI(
     description="Camp Linux 커뮤니티 백엔드 API 서버",
     version="1.0.0",
     lifespan=lifespan,
+    # dict 응답을 표준 json 대신 pydantic-core 인코더로 직렬화
+    default_response_class=FastJSONResponse,
 )
 
 # 요청 상관 ID — 모든 로그에 request_id를 주입 (가장 바깥 미들웨어)
@@ -0,0 +1,60 @@
+"""post 테이블에 삭제 여부를 반영한 search_body 생성 컬럼 + FULLTEXT 인덱스 추가.
+
+MySQL FULLTEXT는 부분 인덱스를 지원하지 않으므로, 삭제된 게시글은 빈 문자열이 되는
+STORED 생성 컬럼에 인덱스를 걸어 삭제된 글이 역색인에 토큰을 남기지 않도록 함.
+기존 ft_post_search (title, content) 인덱스는 대체되어 제거.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from sqlalchemy import text
+
+revision: str = "0005"
+down_revision: str | None = "0004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    # search_body 컬럼 존재 여부로 멱등성 판단
+    result = conn.execute(
+        text(
+            "SELECT COUNT(*) FROM information_schema.columns "
+            "WHERE table_schema = DATABASE() AND table_name = 'post' "
+            "AND column_name = 'search_body'"
+        )
+    )
+    if not result.scalar():
+        conn.execute(
+            text(
+                "ALTER TABLE post ADD COLUMN search_body TEXT GENERATED ALWAYS AS "
+                "(IF(deleted_at IS NULL, CONCAT_WS(' ', title, content), '')) STORED"
+            )
+        )
+        conn.execute(text("ALTER TABLE post ADD FULLTEXT INDEX ft_post_search_body (search_body) WITH PARSER ngram"))
+
+    # 기존 (title, content) FULLTEXT 인덱스 제거
+    result = conn.execute(
+        text(
+            "SELECT COUNT(*) FROM information_schema.statistics "
+            "WHERE table_schema = DATABASE() AND table_name = 'post' "
+            "AND index_name = 'ft_post_search'"
+        )
+    )
+    if result.scalar():
+        conn.execute(text("ALTER TABLE post DROP INDEX ft_post_search"))
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+
+    conn.execute(text("ALTER TABLE post ADD FULLTEXT INDEX ft_post_search (title, content) WITH PARSER ngram"))
+    conn.execute(text("ALTER TABLE post DROP INDEX ft_post_search_body"))
+    conn.execute(text("ALTER TABLE post DROP COLUMN search_body"))
@@ -0,0 +1,39 @@
+"""refresh_token.expires_at 인덱스 추가.
+
+만료 토큰 정리(LIMIT 배치 DELETE)가 만료된 행만 범위 스캔하도록 함.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from sqlalchemy import text
+
+revision: str = "0006"
+down_revision: str | None = "0005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    # 인덱스 존재 여부로 멱등성 판단
+    result = conn.execute(
+        text(
+            "SELECT COUNT(*) FROM information_schema.statistics "
+            "WHERE table_schema = DATABASE() AND table_name = 'refresh_token' "
+            "AND index_name = 'idx_refresh_token_expires'"
+        )
+    )
+    if not result.scalar():
+        conn.execute(text("CREATE INDEX idx_refresh_token_expires ON refresh_token (expires_at)"))
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+
+    conn.execute(text("DROP INDEX idx_refresh_token_expires ON refresh_token"))
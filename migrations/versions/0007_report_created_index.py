@@ -0,0 +1,40 @@
+"""report.created_at 인덱스 추가.
+
+상태 필터 없는 신고 목록(ORDER BY created_at DESC LIMIT)이 filesort 없이 인덱스 순서로 읽도록 함.
+상태 필터 목록은 기존 idx_report_status (status, created_at DESC)를 사용.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from sqlalchemy import text
+
+revision: str = "0007"
+down_revision: str | None = "0006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    # 인덱스 존재 여부로 멱등성 판단
+    result = conn.execute(
+        text(
+            "SELECT COUNT(*) FROM information_schema.statistics "
+            "WHERE table_schema = DATABASE() AND table_name = 'report' "
+            "AND index_name = 'idx_report_created'"
+        )
+    )
+    if not result.scalar():
+        conn.execute(text("CREATE INDEX idx_report_created ON report (created_at DESC)"))
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+
+    conn.execute(text("DROP INDEX idx_report_created ON report"))
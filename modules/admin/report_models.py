@@ -1,16 +1,36 @@
 """report_models: 신고 관련 데이터 모델 및 함수 모듈."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
 
-from core.database.connection import get_cursor, transactional
+from core.database.connection import db_timestamp, get_cursor, transactional
 
+# 컬럼 순서는 Report 필드 순서와 같아야 함 — Report(*row)로 위치 기반 생성
 _REPORT_COLUMNS = (
     "id, reporter_id, target_type, target_id, reason, description, status, resolved_by, resolved_at, created_at"
 )
 
-
-@dataclass(frozen=True)
+# 목록/개수 쿼리는 상태 필터 유무 두 가지뿐이므로 SQL 텍스트를 상수로 고정 — 호출마다 문자열을 조립하지 않음
+_SELECT_REPORTS_PAGE_TEMPLATE = """
+    SELECT r.id AS report_id, r.reporter_id, r.target_type, r.target_id,
+           r.reason, r.description, r.status,
+           r.resolved_by, r.resolved_at, r.created_at,
+           u.nickname AS reporter_nickname,
+           COUNT(*) OVER () AS total_count
+    FROM report r
+    LEFT JOIN user u ON r.reporter_id = u.id
+    {where}
+    ORDER BY r.created_at DESC
+    LIMIT %s OFFSET %s
+"""
+_SELECT_REPORTS_PAGE_SQL = _SELECT_REPORTS_PAGE_TEMPLATE.format(where="")
+_SELECT_REPORTS_PAGE_BY_STATUS_SQL = _SELECT_REPORTS_PAGE_TEMPLATE.format(where="WHERE r.status = %s")
+
+_COUNT_REPORTS_SQL = "SELECT COUNT(*) AS cnt FROM report"
+_COUNT_REPORTS_BY_STATUS_SQL = "SELECT COUNT(*) AS cnt FROM report WHERE status = %s"
+
+
+@dataclass(frozen=True, slots=True)
 class Report:
     """신고 데이터 클래스."""
 
@@ -33,7 +53,10 @@ async def create_report(
     reason: str,
     description: str | None = None,
 ) -> Report:
-    """신고를 생성합니다. IntegrityError는 전파하여 controller에서 처리합니다."""
+    """신고를 생성합니다. IntegrityError는 전파하여 controller에서 처리합니다.
+
+    삽입 직후 재조회 없이 입력값과 lastrowid, 컬럼 기본값으로 Report를 구성합니다.
+    """
     async with transactional() as cur:
         await cur.execute(
             "INSERT INTO report (reporter_id, target_type, target_id, reason, description) VALUES (%s, %s, %s, %s, %s)",
@@ -41,93 +64,99 @@ async def create_report(
         )
         report_id = cur.lastrowid
 
-        await cur.execute(f"SELECT {_REPORT_COLUMNS} FROM report WHERE id = %s", (report_id,))
-        row = await cur.fetchone()
-        return Report(**row)
-
-
-async def get_reports(
+    return Report(
+        id=report_id,
+        reporter_id=reporter_id,
+        target_type=target_type,
+        target_id=target_id,
+        reason=reason,
+        description=description,
+        status="pending",
+        resolved_by=None,
+        resolved_at=None,
+        created_at=db_timestamp(),
+    )
+
+
+async def get_reports_page(
     status: str | None = None,
     offset: int = 0,
     limit: int = 20,
-) -> list[dict]:
-    """신고 목록을 reporter 닉네임과 함께 조회합니다."""
-    async with get_cursor() as cur:
-        where = "1=1"
-        params: list = []
+) -> tuple[list[dict], int]:
+    """신고 목록을 reporter 닉네임과 함께 조회합니다.
+
+    COUNT(*) OVER ()로 필터 결과 전체 개수를 같은 쿼리에서 함께 계산하여
+    목록과 개수를 한 번의 왕복으로 가져옵니다.
 
+    Returns:
+        (신고 목록, 전체 개수) 튜플.
+    """
+    async with get_cursor() as cur:
         if status:
-            where += " AND r.status = %s"
-            params.append(status)
+            await cur.execute(_SELECT_REPORTS_PAGE_BY_STATUS_SQL, (status, limit, offset))
+        else:
+            await cur.execute(_SELECT_REPORTS_PAGE_SQL, (limit, offset))
+        rows = await cur.fetchall()
 
-        params.extend([limit, offset])
+    if not rows:
+        # 범위를 벗어난 페이지는 윈도우 결과가 없으므로 개수만 별도 조회
+        total_count = await get_reports_count(status) if offset > 0 else 0
+        return [], total_count
 
-        await cur.execute(
-            f"""
-                SELECT r.id AS report_id, r.reporter_id, r.target_type, r.target_id,
-                       r.reason, r.description, r.status,
-                       r.resolved_by, r.resolved_at, r.created_at,
-                       u.nickname AS reporter_nickname
-                FROM report r
-                LEFT JOIN user u ON r.reporter_id = u.id
-                WHERE {where}
-                ORDER BY r.created_at DESC
-                LIMIT %s OFFSET %s
-                """,
-            params,
-        )
-        return [dict(row) for row in await cur.fetchall()]
+    # DictCursor 행은 이미 응답 키로 별칭된 dict이므로 복사 없이 그대로 반환
+    total_count = rows[0]["total_count"]
+    for row in rows:
+        del row["total_count"]
+    return list(rows), total_count
 
 
 async def get_reports_count(status: str | None = None) -> int:
     """신고 총 개수를 반환합니다."""
     async with get_cursor() as cur:
-        where = "1=1"
-        params: list = []
-
         if status:
-            where += " AND status = %s"
-            params.append(status)
-
-        await cur.execute(f"SELECT COUNT(*) AS cnt FROM report WHERE {where}", params)
+            await cur.execute(_COUNT_REPORTS_BY_STATUS_SQL, (status,))
+        else:
+            await cur.execute(_COUNT_REPORTS_SQL)
         row = await cur.fetchone()
         return row["cnt"] if row else 0
 
 
 async def get_report_by_id(report_id: int) -> Report | None:
     """ID로 신고를 조회합니다."""
-    async with get_cursor() as cur:
+    async with get_cursor(as_tuple=True) as cur:
         await cur.execute(f"SELECT {_REPORT_COLUMNS} FROM report WHERE id = %s", (report_id,))
         row = await cur.fetchone()
-        return Report(**row) if row else None
+        return Report(*row) if row else None
+
 
+async def resolve_report(report: Report, admin_id: int, new_status: str) -> Report | None:
+    """신고를 처리합니다. pending 상태만 처리 가능합니다.
 
-async def resolve_report(report_id: int, admin_id: int, new_status: str) -> Report | None:
-    """신고를 처리합니다. pending 상태만 처리 가능합니다."""
+    호출자가 미리 조회한 Report에 변경된 필드만 반영하여 반환하므로 UPDATE 후 재조회하지 않습니다.
+    동시에 다른 관리자가 먼저 처리했으면(갱신 행 없음) None을 반환합니다.
+    """
+    # NOW()와 같은 값을 명시적으로 기록 — 반환값이 저장된 값과 일치
+    resolved_at = db_timestamp()
     async with transactional() as cur:
         await cur.execute(
-            "UPDATE report SET status = %s, resolved_by = %s, resolved_at = NOW() WHERE id = %s AND status = 'pending'",
-            (new_status, admin_id, report_id),
+            "UPDATE report SET status = %s, resolved_by = %s, resolved_at = %s WHERE id = %s AND status = 'pending'",
+            (new_status, admin_id, resolved_at, report.id),
         )
         if cur.rowcount == 0:
             return None
 
-        await cur.execute(f"SELECT {_REPORT_COLUMNS} FROM report WHERE id = %s", (report_id,))
-        row = await cur.fetchone()
-        return Report(**row) if row else None
+    return replace(report, status=new_status, resolved_by=admin_id, resolved_at=resolved_at)
 
 
-async def reopen_report(report_id: int) -> Report | None:
-    """처리된 신고를 다시 pending 상태로 되돌립니다."""
+async def reopen_report(report: Report) -> Report | None:
+    """처리된 신고를 다시 pending 상태로 되돌립니다. 갱신 행이 없으면 None을 반환합니다."""
     async with transactional() as cur:
         await cur.execute(
             "UPDATE report SET status = 'pending', resolved_by = NULL, resolved_at = NULL "
             "WHERE id = %s AND status != 'pending'",
-            (report_id,),
+            (report.id,),
         )
         if cur.rowcount == 0:
             return None
 
-        await cur.execute(f"SELECT {_REPORT_COLUMNS} FROM report WHERE id = %s", (report_id,))
-        row = await cur.fetchone()
-        return Report(**row) if row else None
+    return replace(report, status="pending", resolved_by=None, resolved_at=None)
@@ -71,12 +71,11 @@ class ReportService:
         limit: int,
     ) -> tuple[list[dict], int, bool]:
         """신고 목록 조회 및 가공."""
-        reports_data = await report_models.get_reports(
+        reports_data, total_count = await report_models.get_reports_page(
             status=status,
             offset=offset,
             limit=limit,
         )
-        total_count = await report_models.get_reports_count(status=status)
         has_more = offset + limit < total_count
 
         for report in reports_data:
@@ -111,7 +110,7 @@ class ReportService:
             )
 
         # 2. 신고 처리
-        resolved = await report_models.resolve_report(report_id, admin_id, new_status)
+        resolved = await report_models.resolve_report(report, admin_id, new_status)
         if not resolved:
             raise not_found_error("report", timestamp)
 
@@ -173,7 +172,7 @@ class ReportService:
                 "이미 대기 중인 신고입니다.",
             )
 
-        reopened = await report_models.reopen_report(report_id)
+        reopened = await report_models.reopen_report(report)
         if not reopened:
             raise not_found_error("report", timestamp)
 
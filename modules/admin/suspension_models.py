@@ -3,6 +3,7 @@
 from datetime import UTC, datetime, timedelta
 
 from core.database.connection import transactional
+from modules.user import cache as user_cache
 
 
 async def suspend_user(user_id: int, duration_days: int, reason: str) -> bool:
@@ -14,7 +15,11 @@ async def suspend_user(user_id: int, duration_days: int, reason: str) -> bool:
             "UPDATE user SET suspended_until = %s, suspended_reason = %s WHERE id = %s AND deleted_at IS NULL",
             (suspended_until, reason, user_id),
         )
-        return cur.rowcount > 0
+        suspended = cur.rowcount > 0
+
+    # 정지가 캐시 TTL 동안 지연되지 않도록 즉시 무효화
+    await user_cache.invalidate(user_id)
+    return suspended
 
 
 async def unsuspend_user(user_id: int) -> bool:
@@ -25,4 +30,7 @@ async def unsuspend_user(user_id: int) -> bool:
             "WHERE id = %s AND deleted_at IS NULL AND suspended_until IS NOT NULL",
             (user_id,),
         )
-        return cur.rowcount > 0
+        unsuspended = cur.rowcount > 0
+
+    await user_cache.invalidate(user_id)
+    return unsuspended
@@ -204,7 +204,7 @@ async def verify_email(token: str, request: Request) -> dict:
     timestamp = get_request_timestamp(request)
 
     # verify_token은 토큰 검증 + 사용자 email_verified 업데이트를 원자적으로 수행
-    # None 반환 시 토큰이 없거나 만료됨 — 재사용 방지를 위해 검증 즉시 DB에서 삭제됨
+    # None 반환 시 토큰이 없거나 만료됨 — 유효한 토큰은 재사용 방지를 위해 검증 즉시 DB에서 삭제됨
     user_id = await verification_models.verify_token(token)
     if not user_id:
         raise bad_request_error(ErrorCode.INVALID_OR_EXPIRED_TOKEN, timestamp)
@@ -4,7 +4,6 @@ JWT 기반 로그인, 로그아웃, 토큰 갱신의 핵심 비즈니스 로직
 HTTP 관련 처리(쿠키, Request/Response)는 컨트롤러에 위임합니다.
 """
 
-import asyncio
 import logging
 import secrets
 from dataclasses import dataclass
@@ -15,7 +14,7 @@ from fastapi import HTTPException, status
 
 from core.config import settings
 from core.utils.jwt_utils import create_access_token, create_refresh_token, hash_refresh_token
-from core.utils.password import verify_password
+from core.utils.password import verify_password_async
 from modules.auth import token_models
 from modules.user import models as user_models
 from modules.user.models import User
@@ -62,7 +61,7 @@ class AuthService:
 
         # 소셜 전용 계정(password=NULL): 타이밍 공격 방지 후 안내 메시지 반환
         if user and user.password is None:
-            await asyncio.to_thread(verify_password, password, _TIMING_ATTACK_DUMMY_HASH)
+            await verify_password_async(password, _TIMING_ATTACK_DUMMY_HASH)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={
@@ -72,8 +71,7 @@ class AuthService:
                 },
             )
 
-        password_valid = await asyncio.to_thread(
-            verify_password,
+        password_valid = await verify_password_async(
             password,
             (user.password or _TIMING_ATTACK_DUMMY_HASH) if user else _TIMING_ATTACK_DUMMY_HASH,
         )
@@ -144,7 +142,7 @@ class AuthService:
             컨트롤러에서 쿠키 삭제가 필요한 경우를 구분하기 위해,
             쿠키 삭제가 필요한 실패 케이스에서 HTTPException을 발생시킵니다.
         """
-        # 만료된 토큰이면 내부에서 삭제 후 None 반환
+        # 만료된 토큰이면 None 반환 (만료 행은 주기적 정리 작업이 삭제)
         token_record = await token_models.get_refresh_token(refresh_token_value)
         if not token_record:
             raise HTTPException(
@@ -174,7 +172,7 @@ class AuthService:
                 },
             )
 
-        # 토큰 원자적 회전: SELECT FOR UPDATE + DELETE + INSERT를 단일 트랜잭션으로 묶어
+        # 토큰 원자적 회전: 조건부 DELETE(검증+잠금) + INSERT를 단일 트랜잭션으로 묶어
         # 동시 갱신 요청이 모두 성공하는 팬아웃(fan-out)을 방지
         new_access_token = create_access_token(user_id=user.id)
         new_raw_refresh = create_refresh_token()
@@ -257,7 +257,7 @@ async def complete_signup(
             "이미 사용 중인 닉네임입니다.",
             data={},
         )
-    updated_user = await user_models.update_nickname_set(current_user.id, body.nickname)
+    updated_user = await user_models.update_nickname_set(current_user.id, body.nickname, current=current_user)
     if not updated_user:
         return create_response(
             "USER_NOT_FOUND",
@@ -6,7 +6,8 @@ refresh_token 테이블의 CRUD 기능과 만료 토큰 정리 기능을 제공
 import logging
 from datetime import UTC, datetime
 
-from core.database.connection import transactional
+from core.database.connection import get_cursor, transactional
+from core.utils.clock import utc_now
 from core.utils.jwt_utils import hash_refresh_token
 
 logger = logging.getLogger("api")
@@ -16,7 +17,13 @@ _SELECT_TOKEN_SQL = """
     SELECT user_id, expires_at
     FROM refresh_token
     WHERE token_hash = %s
-    FOR UPDATE
+"""
+
+# 회전 시 기존 토큰 검증과 삭제를 한 문장으로 — 삭제된 행이 없으면 무효(없음/만료/사용자 불일치)
+# expires_at은 애플리케이션이 UTC로 기록하므로 비교 시각도 DB NOW()가 아닌 utc_now()를 전달
+_DELETE_VALID_TOKEN_SQL = """
+    DELETE FROM refresh_token
+    WHERE token_hash = %s AND user_id = %s AND expires_at >= %s
 """
 
 # 공통 INSERT SQL — create/rotate에서 동일한 형태로 토큰을 삽입
@@ -25,6 +32,11 @@ _INSERT_TOKEN_SQL = """
     VALUES (%s, %s, %s)
 """
 
+# 만료 토큰 정리 배치 크기 — expires_at 인덱스로 만료된 행만 범위 스캔
+_CLEANUP_BATCH_SIZE = 1000
+
+_DELETE_EXPIRED_TOKENS_SQL = "DELETE FROM refresh_token WHERE expires_at < %s LIMIT %s"
+
 
 def _normalize_expires_at(expires_at: datetime) -> datetime:
     """MySQL TIMESTAMP가 timezone-naive로 반환될 경우 UTC로 보정합니다."""
@@ -41,25 +53,25 @@ async def create_refresh_token(user_id: int, raw_token: str, expires_at: datetim
 
 
 async def get_refresh_token(raw_token: str) -> dict | None:
-    """Raw Refresh Token으로 토큰 레코드를 조회합니다. 만료된 토큰은 삭제 후 None 반환."""
+    """Raw Refresh Token으로 토큰 레코드를 조회합니다. 만료된 토큰은 None 반환.
+
+    읽기 경로에서는 쓰기를 하지 않습니다 — 만료 행은 cleanup_expired_tokens()가
+    주기적으로(`POST /v1/admin/cleanup/tokens`) 정리합니다. 행 잠금은 이후
+    atomic_rotate_refresh_token()이 잡으므로 여기서는 잠금 없이 읽습니다.
+    """
     token_hash = hash_refresh_token(raw_token)
-    async with transactional() as cur:
+    async with get_cursor() as cur:
         await cur.execute(_SELECT_TOKEN_SQL, (token_hash,))
         row = await cur.fetchone()
 
-        if not row:
-            return None
-
-        user_id, expires_at = row["user_id"], _normalize_expires_at(row["expires_at"])
+    if not row:
+        return None
 
-        if expires_at < datetime.now(UTC):
-            await cur.execute(
-                "DELETE FROM refresh_token WHERE token_hash = %s",
-                (token_hash,),
-            )
-            return None
+    user_id, expires_at = row["user_id"], _normalize_expires_at(row["expires_at"])
+    if expires_at < utc_now():
+        return None
 
-        return {"user_id": user_id, "expires_at": expires_at}
+    return {"user_id": user_id, "expires_at": expires_at}
 
 
 async def delete_refresh_token(raw_token: str) -> None:
@@ -78,35 +90,35 @@ async def atomic_rotate_refresh_token(
     new_token_hash: str,
     new_expires_at: datetime,
 ) -> int | None:
-    """기존 Refresh Token 검증·삭제·신규 토큰 삽입을 단일 트랜잭션으로 수행합니다."""
-    async with transactional() as cur:
-        await cur.execute(_SELECT_TOKEN_SQL, (old_token_hash,))
-        row = await cur.fetchone()
+    """기존 Refresh Token 검증·삭제·신규 토큰 삽입을 단일 트랜잭션으로 수행합니다.
 
-        if not row:
-            return None
-
-        db_user_id, expires_at = row["user_id"], _normalize_expires_at(row["expires_at"])
-
-        if expires_at < datetime.now(UTC) or db_user_id != user_id:
+    조건부 DELETE가 검증과 행 잠금을 겸하므로 SELECT ... FOR UPDATE 왕복이 필요 없습니다.
+    동시 회전 요청은 같은 행의 DELETE에서 직렬화되고, 뒤따른 요청은 삭제된 행이 없어 실패합니다.
+    """
+    async with transactional() as cur:
+        await cur.execute(_DELETE_VALID_TOKEN_SQL, (old_token_hash, user_id, utc_now()))
+        if cur.rowcount == 0:
             return None
 
-        await cur.execute(
-            "DELETE FROM refresh_token WHERE token_hash = %s",
-            (old_token_hash,),
-        )
         await cur.execute(_INSERT_TOKEN_SQL, (user_id, new_token_hash, new_expires_at))
 
     return user_id
 
 
 async def cleanup_expired_tokens() -> int:
-    """만료된 Refresh Token을 일괄 삭제합니다."""
-    async with transactional() as cur:
-        await cur.execute(
-            "DELETE FROM refresh_token WHERE expires_at < %s",
-            (datetime.now(UTC),),
-        )
-        deleted = cur.rowcount
+    """만료된 Refresh Token을 배치 단위로 삭제합니다.
+
+    한 번의 무제한 DELETE는 큰 테이블에서 행 잠금을 오래 잡고 binlog를 키우므로,
+    _CLEANUP_BATCH_SIZE개씩 나누어 배치마다 커밋합니다.
+    """
+    now = datetime.now(UTC)
+    deleted = 0
+    while True:
+        async with transactional() as cur:
+            await cur.execute(_DELETE_EXPIRED_TOKENS_SQL, (now, _CLEANUP_BATCH_SIZE))
+            batch_deleted = cur.rowcount
+        deleted += batch_deleted
+        if batch_deleted < _CLEANUP_BATCH_SIZE:
+            break
     logger.info("만료된 Refresh Token %d개 정리 완료", deleted)
     return deleted
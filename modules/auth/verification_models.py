@@ -6,21 +6,31 @@ SHA-256 해시 패턴은 refresh_token과 동일합니다.
 
 import logging
 import secrets
-from datetime import UTC, datetime, timedelta
+from datetime import timedelta
 
-from core.database.connection import get_cursor, transactional
+from core.database.connection import transactional
+from core.utils.clock import utc_now
 from core.utils.jwt_utils import hash_refresh_token
+from modules.user import cache as user_cache
 
 logger = logging.getLogger("api")
 
 _VERIFICATION_EXPIRE_HOURS = 24
 
+# 원본 토큰 난수 바이트 수 (256비트) — 저장은 SHA-256 해시이므로 길이는 추측 불가능성만 좌우
+_VERIFICATION_TOKEN_BYTES = 32
+
+# 만료 토큰 정리 배치 크기 — expires_at 인덱스로 만료된 행만 범위 스캔
+_CLEANUP_BATCH_SIZE = 1000
+
+_DELETE_EXPIRED_TOKENS_SQL = "DELETE FROM email_verification WHERE expires_at < %s LIMIT %s"
+
 
 async def create_verification_token(user_id: int) -> str:
     """이메일 인증 토큰을 생성하고 SHA-256 해시를 DB에 저장합니다."""
-    raw_token = secrets.token_urlsafe(64)
+    raw_token = secrets.token_urlsafe(_VERIFICATION_TOKEN_BYTES)
     token_hash = hash_refresh_token(raw_token)
-    expires_at = datetime.now(UTC) + timedelta(hours=_VERIFICATION_EXPIRE_HOURS)
+    expires_at = utc_now() + timedelta(hours=_VERIFICATION_EXPIRE_HOURS)
 
     async with transactional() as cur:
         await cur.execute(
@@ -32,31 +42,25 @@ async def create_verification_token(user_id: int) -> str:
 
 
 async def verify_token(raw_token: str) -> int | None:
-    """인증 토큰을 검증하고 성공 시 email_verified를 갱신합니다."""
+    """인증 토큰을 검증하고 성공 시 email_verified를 갱신합니다.
+
+    만료 여부는 조회 조건으로 판단합니다. 만료된 토큰은 인증에 쓰일 수 없으므로 여기서 지우지 않고
+    cleanup_expired_verification_tokens()에 맡깁니다 — 실패 경로는 조회 한 번으로 끝납니다.
+    """
     token_hash = hash_refresh_token(raw_token)
 
     async with transactional() as cur:
+        # expires_at은 애플리케이션이 UTC로 기록하므로 비교 시각도 DB NOW()가 아닌 utc_now()를 전달
         await cur.execute(
-            "SELECT user_id, expires_at FROM email_verification WHERE token_hash = %s FOR UPDATE",
-            (token_hash,),
+            "SELECT user_id FROM email_verification WHERE token_hash = %s AND expires_at >= %s FOR UPDATE",
+            (token_hash, utc_now()),
         )
         row = await cur.fetchone()
 
         if not row:
             return None
 
-        user_id, expires_at = row["user_id"], row["expires_at"]
-
-        if expires_at.tzinfo is None:
-            expires_at = expires_at.replace(tzinfo=UTC)
-
-        if expires_at < datetime.now(UTC):
-            await cur.execute(
-                "DELETE FROM email_verification WHERE token_hash = %s",
-                (token_hash,),
-            )
-            return None
-
+        user_id = row["user_id"]
         await cur.execute(
             "DELETE FROM email_verification WHERE token_hash = %s",
             (token_hash,),
@@ -66,16 +70,24 @@ async def verify_token(raw_token: str) -> int | None:
             (user_id,),
         )
 
+    await user_cache.invalidate(user_id)
     return user_id
 
 
 async def cleanup_expired_verification_tokens() -> int:
-    """만료된 이메일 인증 토큰을 일괄 삭제합니다."""
-    async with get_cursor() as cur:
-        await cur.execute(
-            "DELETE FROM email_verification WHERE expires_at < %s",
-            (datetime.now(UTC),),
-        )
-        deleted = cur.rowcount
+    """만료된 이메일 인증 토큰을 배치 단위로 삭제합니다.
+
+    refresh_token 정리와 같이 _CLEANUP_BATCH_SIZE개씩 나누어 배치마다 커밋합니다 —
+    verify_token이 잡는 행 잠금과 오래 경합하지 않도록 함.
+    """
+    now = utc_now()
+    deleted = 0
+    while True:
+        async with transactional() as cur:
+            await cur.execute(_DELETE_EXPIRED_TOKENS_SQL, (now, _CLEANUP_BATCH_SIZE))
+            batch_deleted = cur.rowcount
+        deleted += batch_deleted
+        if batch_deleted < _CLEANUP_BATCH_SIZE:
+            break
     logger.info("만료된 이메일 인증 토큰 %d개 정리 완료", deleted)
     return deleted
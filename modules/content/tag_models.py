@@ -33,10 +33,10 @@ async def save_post_tags(post_id: int, tag_ids: list[int]) -> None:
     """게시글의 태그를 교체합니다."""
     async with transactional() as cur:
         await cur.execute("DELETE FROM post_tag WHERE post_id = %s", (post_id,))
-        for tag_id in tag_ids:
-            await cur.execute(
+        if tag_ids:
+            await cur.executemany(
                 "INSERT IGNORE INTO post_tag (post_id, tag_id) VALUES (%s, %s)",
-                (post_id, tag_id),
+                [(post_id, tag_id) for tag_id in tag_ids],
             )
 
 
@@ -48,7 +48,7 @@ async def get_post_tags(post_id: int) -> list[dict]:
             " ON t.id = pt.tag_id WHERE pt.post_id = %s ORDER BY t.name ASC",
             (post_id,),
         )
-        return [dict(row) for row in await cur.fetchall()]
+        return list(await cur.fetchall())
 
 
 async def get_posts_tags(post_ids: list[int]) -> dict[int, list[dict]]:
@@ -84,7 +84,7 @@ async def search_tags(search: str, limit: int = 10) -> list[dict]:
                 """,
             (f"%{escape_like(search)}%", limit),
         )
-        return [dict(row) for row in await cur.fetchall()]
+        return list(await cur.fetchall())
 
 
 async def get_tag_by_name(tag_name: str) -> dict | None:
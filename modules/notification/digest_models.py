@@ -5,12 +5,33 @@
 """
 
 import logging
+from collections.abc import AsyncIterator
 
 from core.database.connection import get_cursor
 
 logger = logging.getLogger(__name__)
 
 
+# 다이제스트 수신 대상 조건 — get_eligible_users/iter_eligible_users 공용
+_ELIGIBLE_USERS_SQL = """
+    SELECT u.id, u.email, u.nickname
+    FROM user u
+    LEFT JOIN notification_setting ns ON u.id = ns.user_id
+    WHERE COALESCE(ns.digest_frequency, 'weekly') = %s
+      AND u.email_verified = 1
+      AND u.deleted_at IS NULL
+      AND (u.suspended_until IS NULL OR u.suspended_until < NOW())
+      AND NOT EXISTS (
+          SELECT 1 FROM post_view_log pvl
+          WHERE pvl.user_id = u.id
+            AND pvl.created_at >= DATE_SUB(NOW(), INTERVAL %s DAY)
+      )
+"""
+
+# 대상 사용자를 나눠 읽는 배치 크기
+_ELIGIBLE_USERS_BATCH_SIZE = 500
+
+
 async def get_eligible_users(frequency: str, lookback_days: int) -> list[dict]:
     """다이제스트 수신 대상 사용자 조회.
 
@@ -22,26 +43,36 @@ async def get_eligible_users(frequency: str, lookback_days: int) -> list[dict]:
     - 탈퇴하지 않음
     """
     async with get_cursor() as cur:
-        await cur.execute(
-            """
-            SELECT u.id, u.email, u.nickname
-            FROM user u
-            LEFT JOIN notification_setting ns ON u.id = ns.user_id
-            WHERE COALESCE(ns.digest_frequency, 'weekly') = %s
-              AND u.email_verified = 1
-              AND u.deleted_at IS NULL
-              AND (u.suspended_until IS NULL OR u.suspended_until < NOW())
-              AND NOT EXISTS (
-                  SELECT 1 FROM post_view_log pvl
-                  WHERE pvl.user_id = u.id
-                    AND pvl.created_at >= DATE_SUB(NOW(), INTERVAL %s DAY)
-              )
-            """,
-            (frequency, lookback_days),
-        )
+        await cur.execute(_ELIGIBLE_USERS_SQL, (frequency, lookback_days))
         return await cur.fetchall()
 
 
+async def iter_eligible_users(
+    frequency: str,
+    lookback_days: int,
+    batch_size: int = _ELIGIBLE_USERS_BATCH_SIZE,
+) -> AsyncIterator[dict]:
+    """다이제스트 수신 대상 사용자를 id 순 keyset 배치로 순회합니다.
+
+    전체 대상을 한 번에 메모리에 올리지 않고, 배치 사이에는 연결을 반환하므로
+    사용자별 발송이 오래 걸려도 결과셋을 열어 둔 채 연결을 점유하지 않습니다.
+    """
+    last_id = 0
+    while True:
+        async with get_cursor() as cur:
+            await cur.execute(
+                f"{_ELIGIBLE_USERS_SQL} AND u.id > %s ORDER BY u.id LIMIT %s",
+                (frequency, lookback_days, last_id, batch_size),
+            )
+            rows = await cur.fetchall()
+
+        for row in rows:
+            yield row
+        if len(rows) < batch_size:
+            return
+        last_id = rows[-1]["id"]
+
+
 async def get_top_posts(lookback_days: int, limit: int = 5) -> list[dict]:
     """기간 내 인기 게시글 (hot score 기준).
 
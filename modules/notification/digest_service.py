@@ -10,11 +10,11 @@ from core.config import settings
 from core.utils.email import send_email
 from core.utils.email_templates import build_digest_html, build_digest_text
 from modules.notification.digest_models import (
-    get_eligible_users,
     get_following_posts,
     get_subscription_update_count,
     get_top_posts,
     get_unread_notification_count,
+    iter_eligible_users,
 )
 
 logger = logging.getLogger(__name__)
@@ -40,12 +40,10 @@ async def send_digests() -> dict:
 
     for freq in frequencies:
         lookback = _LOOKBACK[freq]
-        users = await get_eligible_users(freq, lookback)
-
         # 전체 인기 게시글은 주파수별 1회만 조회
         top_posts = await get_top_posts(lookback, limit=5)
 
-        for user in users:
+        async for user in iter_eligible_users(freq, lookback):
             try:
                 user_id = user["id"]
 
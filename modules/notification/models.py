@@ -50,14 +50,9 @@ async def create_notification(
             from core.utils.websocket_pusher import push_to_user
 
             if actor_nickname is None:
-                async with get_cursor() as cur:
-                    await cur.execute(
-                        "SELECT nickname FROM user WHERE id = %s AND deleted_at IS NULL",
-                        (actor_id,),
-                    )
-                    row = await cur.fetchone()
-                    if row:
-                        actor_nickname = row["nickname"]
+                from modules.user.models import get_nicknames_by_ids
+
+                actor_nickname = (await get_nicknames_by_ids([actor_id])).get(actor_id)
 
             await push_to_user(
                 user_id,
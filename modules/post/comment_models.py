@@ -14,7 +14,7 @@ from schemas.common import build_author_dict
 ALLOWED_COMMENT_SORT_OPTIONS = {"oldest", "latest", "popular"}
 
 
-@dataclass
+@dataclass(slots=True)
 class Comment:
     """댓글 데이터 클래스.
 
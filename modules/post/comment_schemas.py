@@ -3,25 +3,15 @@
 댓글 생성, 수정 요청 스키마를 정의합니다.
 """
 
-from pydantic import BaseModel, Field, field_validator
+from typing import Annotated
 
+from pydantic import AfterValidator, BaseModel, Field
 
-def _validate_comment_content(v: str) -> str:
-    """댓글 내용을 검증하고 정규화합니다.
+from schemas._text_validators import make_stripped_checker
 
-    Args:
-        v: 입력된 내용.
-
-    Returns:
-        공백이 제거된 검증된 내용.
-
-    Raises:
-        ValueError: 내용이 1자 미만인 경우.
-    """
-    v = v.strip()
-    if len(v) < 1:
-        raise ValueError("댓글 내용은 최소 1자 이상이어야 합니다.")
-    return v
+CommentContent = Annotated[
+    str, Field(min_length=1, max_length=1000), AfterValidator(make_stripped_checker("댓글 내용", 1))
+]
 
 
 class CreateCommentRequest(BaseModel):
@@ -32,14 +22,9 @@ class CreateCommentRequest(BaseModel):
         parent_id: 답글 대상 댓글 ID (1단계만 허용, 선택).
     """
 
-    content: str = Field(..., min_length=1, max_length=1000)
+    content: CommentContent
     parent_id: int | None = Field(None, description="답글 대상 댓글 ID (1단계만 허용)")
 
-    @field_validator("content")
-    @classmethod
-    def validate_content(cls, v: str) -> str:
-        return _validate_comment_content(v)
-
 
 class UpdateCommentRequest(BaseModel):
     """댓글 수정 요청 모델.
@@ -48,9 +33,4 @@ class UpdateCommentRequest(BaseModel):
         content: 새 댓글 내용 (1~1000자).
     """
 
-    content: str = Field(..., min_length=1, max_length=1000)
-
-    @field_validator("content")
-    @classmethod
-    def validate_content(cls, v: str) -> str:
-        return _validate_comment_content(v)
+    content: CommentContent
@@ -11,7 +11,7 @@ from datetime import datetime
 from core.database.connection import get_cursor, transactional
 
 
-@dataclass
+@dataclass(slots=True)
 class Like:
     """좋아요 데이터 클래스.
 
@@ -39,6 +39,23 @@ async def get_like(post_id: int, user_id: int) -> Like | None:
         return Like(**row) if row else None
 
 
+async def has_liked(post_id: int, user_id: int) -> bool:
+    """특정 사용자가 특정 게시글에 좋아요했는지 여부를 반환합니다."""
+    async with get_cursor(as_tuple=True) as cur:
+        await cur.execute(
+            "SELECT 1 FROM post_like WHERE post_id = %s AND user_id = %s LIMIT 1",
+            (post_id, user_id),
+        )
+        return await cur.fetchone() is not None
+
+
+async def get_post_liker_ids(post_id: int) -> list[int]:
+    """게시글에 좋아요한 사용자 ID 목록을 조회합니다 (좋아요 비트맵 적재용)."""
+    async with get_cursor(as_tuple=True) as cur:
+        await cur.execute("SELECT user_id FROM post_like WHERE post_id = %s", (post_id,))
+        return [row[0] for row in await cur.fetchall()]
+
+
 async def get_post_likes_count(post_id: int) -> int:
     """게시글의 좋아요 개수를 조회합니다."""
     async with get_cursor() as cur:
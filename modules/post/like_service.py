@@ -4,6 +4,7 @@ import logging
 
 from pymysql.err import IntegrityError
 
+from core.utils import like_bitmap
 from core.utils.error_codes import ErrorCode
 from core.utils.exceptions import conflict_error, not_found_error, safe_notify
 from modules.post import like_models, post_models
@@ -14,6 +15,23 @@ logger = logging.getLogger(__name__)
 class LikeService:
     """게시글 좋아요 관리 서비스."""
 
+    @staticmethod
+    async def is_liked(post_id: int, user_id: int) -> bool:
+        """사용자의 게시글 좋아요 여부를 반환합니다.
+
+        비트맵 캐시가 적재되어 있으면 Redis에서 판정하고, 아니면 MySQL로 조회합니다.
+        미적재 시 락을 획득한 한 요청만 좋아요 목록을 읽어 비트맵을 적재합니다.
+        """
+        liked = await like_bitmap.is_liked(post_id, user_id)
+        if liked is not None:
+            return liked
+
+        liked = await like_models.has_liked(post_id, user_id)
+        version = await like_bitmap.claim_warmup(post_id)
+        if version is not None:
+            await like_bitmap.warm(post_id, await like_models.get_post_liker_ids(post_id), version)
+        return liked
+
     @staticmethod
     async def like_post(
         post_id: int,
@@ -45,6 +63,7 @@ class LikeService:
         except IntegrityError:
             raise conflict_error(ErrorCode.ALREADY_LIKED, timestamp, "이미 좋아요를 누른 게시글입니다.") from None
 
+        await like_bitmap.mark(post_id, user_id, liked=True)
         likes_count = await like_models.get_post_likes_count(post_id)
 
         # 자기 글이 아닌 경우 알림 생성
@@ -108,6 +127,7 @@ class LikeService:
         if not removed:
             raise not_found_error("like", timestamp)
 
+        await like_bitmap.mark(post_id, user_id, liked=False)
         likes_count = await like_models.get_post_likes_count(post_id)
 
         # 평판 포인트 회수 (best-effort)
@@ -18,10 +18,10 @@ async def create_poll(
             (post_id, question, expires_at),
         )
         poll_id = cur.lastrowid
-        for i, option_text in enumerate(options):
-            await cur.execute(
+        if options:
+            await cur.executemany(
                 "INSERT INTO poll_option (poll_id, option_text, sort_order) VALUES (%s, %s, %s)",
-                (poll_id, option_text, i),
+                [(poll_id, option_text, i) for i, option_text in enumerate(options)],
             )
     return poll_id
 
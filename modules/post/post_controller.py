@@ -2,7 +2,7 @@ from fastapi import HTTPException, Request, UploadFile, status
 
 from core.dependencies.request_context import get_request_timestamp
 from core.utils.exceptions import bad_request_error, forbidden_error, not_found_error
-from core.utils.pagination import validate_pagination
+from core.utils.pagination import decode_cursor, validate_pagination
 from core.utils.upload import save_file
 from modules.post.post_models import ALLOWED_SORT_OPTIONS
 from modules.post.post_schemas import CreatePostRequest, UpdatePostRequest
@@ -25,6 +25,7 @@ async def get_posts(
     tag: str | None = None,
     following: bool = False,
     solved: bool | None = None,
+    cursor: str | None = None,
 ) -> dict:
     """
     게시글 목록을 조회합니다.
@@ -36,6 +37,7 @@ async def get_posts(
         search (str | None): 검색어 (제목+내용). None이면 전체 조회.
         sort (str): 정렬 옵션 (latest, likes, views, comments).
         author_id (int | None): 작성자 ID로 필터링. None이면 전체 조회.
+        cursor (str | None): 이전 응답의 next_cursor. latest 정렬에서 offset 대신 사용.
 
     Returns:
         dict: 게시글 목록과 페이지네이션 정보를 포함한 응답 딕셔너리
@@ -57,6 +59,9 @@ async def get_posts(
     if sort not in ALLOWED_SORT_OPTIONS:
         sort = "latest"
 
+    # 잘못된 커서는 조용히 무시하면 첫 페이지가 중복 노출되므로 400으로 거절
+    after = decode_cursor(cursor, timestamp) if cursor else None
+
     # Service Layer 호출
     result = await PostService.get_posts(
         offset,
@@ -69,6 +74,7 @@ async def get_posts(
         tag=tag,
         following=following,
         solved=solved,
+        after=after,
     )
 
     response_data = {
@@ -78,6 +84,7 @@ async def get_posts(
             "limit": limit,
             "total_count": result.total_count,
             "has_more": result.has_more,
+            "next_cursor": result.next_cursor,
         },
     }
 
@@ -8,7 +8,6 @@ from datetime import datetime
 
 from core.database.connection import get_cursor, transactional
 from core.utils.formatters import escape_fulltext_query
-from modules.post.comment_models import get_comments_with_author
 from schemas.common import build_author_dict
 
 # 게시글당 허용되는 최대 이미지 수
@@ -43,7 +42,7 @@ ALLOWED_SORT_OPTIONS = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class Post:
     """게시글 데이터 클래스."""
 
@@ -65,27 +64,78 @@ class Post:
         return self.deleted_at is not None
 
 
-def _row_to_post(row: dict) -> Post:
-    """DictCursor 결과를 Post 객체로 변환합니다. is_pinned의 bool 변환을 보장합니다."""
+def _row_to_post(row: tuple) -> Post:
+    """튜플 커서 결과(_POST_COLUMNS 순서)를 Post 객체로 변환합니다. is_pinned의 bool 변환을 보장합니다."""
+    (
+        post_id,
+        title,
+        content,
+        image_url,
+        author_id,
+        category_id,
+        is_pinned,
+        views,
+        created_at,
+        updated_at,
+        deleted_at,
+    ) = row
     return Post(
-        id=row["id"],
-        title=row["title"],
-        content=row["content"],
-        image_url=row["image_url"],
-        author_id=row["author_id"],
-        category_id=row["category_id"],
-        is_pinned=bool(row["is_pinned"]),
-        views=row["views"],
-        created_at=row["created_at"],
-        updated_at=row["updated_at"],
-        deleted_at=row["deleted_at"],
+        id=post_id,
+        title=title,
+        content=content,
+        image_url=image_url,
+        author_id=author_id,
+        category_id=category_id,
+        is_pinned=bool(is_pinned),
+        views=views,
+        created_at=created_at,
+        updated_at=updated_at,
+        deleted_at=deleted_at,
     )
 
 
+# _row_to_post()의 언패킹 순서와 반드시 일치해야 함
 _POST_COLUMNS = (
     "id, title, content, image_url, author_id, category_id, is_pinned, views, created_at, updated_at, deleted_at"
 )
 
+# 모듈 로드 시 한 번만 조립되는 고정 SQL — 호출마다 f-string을 다시 만들지 않음
+_SELECT_POST_SQL = f"SELECT {_POST_COLUMNS} FROM post WHERE id = %s"
+_SELECT_ACTIVE_POST_SQL = f"{_SELECT_POST_SQL} AND deleted_at IS NULL"
+_INSERT_POST_IMAGE_SQL = "INSERT INTO post_image (post_id, image_url, sort_order) VALUES (%s, %s, %s)"
+
+# 기본 별칭(likes, comments)의 Hot Score 수식
+_HOT_SCORE_SQL = hot_score_sql()
+
+# 목록/연관 게시글 공통: 좋아요·댓글·북마크 수 집계 파생 테이블 JOIN
+_POST_COUNTS_JOIN_SQL = """
+                LEFT JOIN (
+                    SELECT post_id, COUNT(*) AS cnt
+                    FROM post_like
+                    GROUP BY post_id
+                ) likes ON p.id = likes.post_id
+                LEFT JOIN (
+                    SELECT post_id, COUNT(*) AS cnt
+                    FROM comment
+                    WHERE deleted_at IS NULL
+                    GROUP BY post_id
+                ) comments ON p.id = comments.post_id
+                LEFT JOIN (
+                    SELECT post_id, COUNT(*) AS cnt
+                    FROM post_bookmark
+                    GROUP BY post_id
+                ) bk ON p.id = bk.post_id"""
+
+
+def _content_column_sql(preview_len: int | None) -> tuple[str, list]:
+    """목록용 content 컬럼 SQL과 파라미터를 반환합니다.
+
+    preview_len이 주어지면 LEFT()로 앞부분만 전송하여 긴 본문이 매 페이지 네트워크를 타지 않게 합니다.
+    """
+    if preview_len is None:
+        return "p.content", []
+    return "LEFT(p.content, %s) AS content", [preview_len]
+
 
 # ============ 게시글 관련 함수 ============
 
@@ -98,12 +148,19 @@ async def get_total_posts_count(
     tag: str | None = None,
     author_ids: set[int] | None = None,
     solved: bool | None = None,
+    post_ids: list[int] | None = None,
 ) -> int:
     """삭제되지 않은 게시글의 총 개수를 반환합니다."""
     async with get_cursor() as cur:
         where = "deleted_at IS NULL"
         params: list = []
 
+        # 외부 검색 엔진 결과로 후보 게시글 제한
+        if post_ids is not None:
+            placeholders = ", ".join(["%s"] * len(post_ids))
+            where += f" AND id IN ({placeholders})"
+            params.extend(post_ids)
+
         if solved is True:
             where += " AND accepted_answer_id IS NOT NULL"
         elif solved is False:
@@ -111,7 +168,7 @@ async def get_total_posts_count(
 
         if search:
             escaped = escape_fulltext_query(search)
-            where += " AND MATCH(title, content) AGAINST(%s IN BOOLEAN MODE)"
+            where += " AND MATCH(search_body) AGAINST(%s IN BOOLEAN MODE)"
             params.append(escaped)
 
         if author_id is not None:
@@ -149,11 +206,8 @@ async def get_total_posts_count(
 
 async def get_post_by_id(post_id: int) -> Post | None:
     """ID로 게시글을 조회합니다."""
-    async with get_cursor() as cur:
-        await cur.execute(
-            f"SELECT {_POST_COLUMNS} FROM post WHERE id = %s AND deleted_at IS NULL",
-            (post_id,),
-        )
+    async with get_cursor(as_tuple=True) as cur:
+        await cur.execute(_SELECT_ACTIVE_POST_SQL, (post_id,))
         row = await cur.fetchone()
         return _row_to_post(row) if row else None
 
@@ -166,17 +220,14 @@ async def create_post(
     category_id: int | None = None,
 ) -> Post:
     """새 게시글을 생성합니다."""
-    async with transactional() as cur:
+    async with transactional(as_tuple=True) as cur:
         await cur.execute(
             "INSERT INTO post (title, content, image_url, author_id, category_id) VALUES (%s, %s, %s, %s, %s)",
             (title, content, image_url, author_id, category_id),
         )
         post_id = cur.lastrowid
 
-        await cur.execute(
-            f"SELECT {_POST_COLUMNS} FROM post WHERE id = %s",
-            (post_id,),
-        )
+        await cur.execute(_SELECT_POST_SQL, (post_id,))
         row = await cur.fetchone()
         return _row_to_post(row)
 
@@ -221,7 +272,7 @@ async def update_post(
         if column_name not in ALLOWED_POST_COLUMNS:
             raise ValueError(f"Invalid column name: {column_name}")
 
-    async with transactional() as cur:
+    async with transactional(as_tuple=True) as cur:
         await cur.execute(
             f"UPDATE post SET {', '.join(updates)} WHERE id = %s AND deleted_at IS NULL",
             (*params, post_id),
@@ -230,10 +281,7 @@ async def update_post(
         if cur.rowcount == 0:
             return None
 
-        await cur.execute(
-            f"SELECT {_POST_COLUMNS} FROM post WHERE id = %s",
-            (post_id,),
-        )
+        await cur.execute(_SELECT_POST_SQL, (post_id,))
         row = await cur.fetchone()
         return _row_to_post(row) if row else None
 
@@ -289,14 +337,34 @@ async def get_posts_with_details(
     author_ids: set[int] | None = None,
     current_user_id: int | None = None,
     solved: bool | None = None,
+    after: tuple[datetime, int] | None = None,
+    content_preview_len: int | None = None,
+    post_ids: list[int] | None = None,
 ) -> list[dict]:
-    """게시글 목록을 작성자 정보, 좋아요 수, 댓글 수, 북마크 수와 함께 조회합니다."""
+    """게시글 목록을 작성자 정보, 좋아요 수, 댓글 수, 북마크 수와 함께 조회합니다.
+
+    after=(created_at, id)가 주어지고 latest 정렬이면 OFFSET 대신 keyset 조건으로
+    다음 페이지를 조회합니다. 고정 게시글은 첫 페이지에만 노출되므로 제외합니다.
+    content_preview_len이 주어지면 content는 해당 글자 수까지만 조회합니다.
+    post_ids가 주어지면 해당 게시글(외부 검색 엔진 결과)로 후보를 제한합니다.
+    """
     # SQL Injection 방지: whitelist 검증 후 fallback
     order_by = ALLOWED_SORT_OPTIONS.get(sort, ALLOWED_SORT_OPTIONS["latest"])
 
     where = "p.deleted_at IS NULL"
     params: list = []
 
+    if post_ids is not None:
+        placeholders = ", ".join(["%s"] * len(post_ids))
+        where += f" AND p.id IN ({placeholders})"
+        params.extend(post_ids)
+
+    # keyset 페이지네이션: 깊은 페이지에서도 OFFSET만큼 행을 버리지 않고 인덱스 범위 스캔
+    if after is not None and sort == "latest":
+        where += " AND p.is_pinned = 0 AND (p.created_at, p.id) < (%s, %s)"
+        params.extend(after)
+        offset = 0
+
     if solved is True:
         where += " AND p.accepted_answer_id IS NOT NULL"
     elif solved is False:
@@ -304,7 +372,7 @@ async def get_posts_with_details(
 
     if search:
         escaped = escape_fulltext_query(search)
-        where += " AND MATCH(p.title, p.content) AGAINST(%s IN BOOLEAN MODE)"
+        where += " AND MATCH(p.search_body) AGAINST(%s IN BOOLEAN MODE)"
         params.append(escaped)
 
     if author_id is not None:
@@ -356,12 +424,13 @@ async def get_posts_with_details(
         watch_params = [current_user_id]
 
     params.extend([limit, offset])
+    content_sql, content_params = _content_column_sql(content_preview_len)
 
-    async with get_cursor() as cur:
+    async with get_cursor(as_tuple=True) as cur:
         await cur.execute(
             f"""
                 SELECT
-                    p.id AS post_id, p.title, p.content, p.image_url, p.views AS views_count,
+                    p.id AS post_id, p.title, {content_sql}, p.image_url, p.views AS views_count,
                     p.created_at, p.updated_at,
                     u.id AS author_user_id, u.nickname AS author_nickname,
                     u.profile_img AS author_profile_img, u.distro AS author_distro,
@@ -370,64 +439,69 @@ async def get_posts_with_details(
                     p.is_pinned, p.category_id, cat.name AS category_name,
                     COALESCE(bk.cnt, 0) AS bookmarks_count,
                     (p.accepted_answer_id IS NOT NULL) AS is_solved,
-                    {hot_score_sql()} AS hot_score
+                    {_HOT_SCORE_SQL} AS hot_score
                     {watch_select}
                     {upc_select}
                 FROM post p
                 LEFT JOIN user u ON p.author_id = u.id
                 LEFT JOIN category cat ON p.category_id = cat.id
-                LEFT JOIN (
-                    SELECT post_id, COUNT(*) AS cnt
-                    FROM post_like
-                    GROUP BY post_id
-                ) likes ON p.id = likes.post_id
-                LEFT JOIN (
-                    SELECT post_id, COUNT(*) AS cnt
-                    FROM comment
-                    WHERE deleted_at IS NULL
-                    GROUP BY post_id
-                ) comments ON p.id = comments.post_id
-                LEFT JOIN (
-                    SELECT post_id, COUNT(*) AS cnt
-                    FROM post_bookmark
-                    GROUP BY post_id
-                ) bk ON p.id = bk.post_id
+                {_POST_COUNTS_JOIN_SQL}
                 {watch_join}
                 {upc_join}
                 WHERE {where}
                 ORDER BY p.is_pinned DESC, {order_by}
                 LIMIT %s OFFSET %s
                 """,
-            [*watch_params, *join_params, *params],
+            [*content_params, *watch_params, *join_params, *params],
         )
         rows = await cur.fetchall()
 
-        return [
+    posts: list[dict] = []
+    for row in rows:
+        # SELECT 순서대로 언패킹 (for_you의 combined_score 등 후행 컬럼은 무시)
+        (
+            post_id,
+            title,
+            content,
+            image_url,
+            views_count,
+            created_at,
+            updated_at,
+            author_user_id,
+            author_nickname,
+            author_profile_img,
+            author_distro,
+            likes_count,
+            comments_count,
+            is_pinned,
+            category_id,
+            category_name,
+            bookmarks_count,
+            is_solved,
+            _hot_score,
+            is_watching,
+        ) = row[:20]
+        posts.append(
             {
-                "post_id": row["post_id"],
-                "title": row["title"],
-                "content": row["content"],
-                "image_url": row["image_url"],
-                "views_count": row["views_count"],
-                "created_at": row["created_at"],
-                "updated_at": row["updated_at"],
-                "author": build_author_dict(
-                    row["author_user_id"],
-                    row["author_nickname"],
-                    row["author_profile_img"],
-                    row["author_distro"],
-                ),
-                "likes_count": row["likes_count"],
-                "comments_count": row["comments_count"],
-                "is_pinned": bool(row["is_pinned"]),
-                "category_id": row["category_id"],
-                "category_name": row["category_name"],
-                "bookmarks_count": row["bookmarks_count"],
-                "is_solved": bool(row.get("is_solved", False)),
-                "is_watching": bool(row.get("is_watching", 0)),
+                "post_id": post_id,
+                "title": title,
+                "content": content,
+                "image_url": image_url,
+                "views_count": views_count,
+                "created_at": created_at,
+                "updated_at": updated_at,
+                "author": build_author_dict(author_user_id, author_nickname, author_profile_img, author_distro),
+                "likes_count": likes_count,
+                "comments_count": comments_count,
+                "is_pinned": bool(is_pinned),
+                "category_id": category_id,
+                "category_name": category_name,
+                "bookmarks_count": bookmarks_count,
+                "is_solved": bool(is_solved),
+                "is_watching": bool(is_watching),
             }
-            for row in rows
-        ]
+        )
+    return posts
 
 
 async def get_post_with_details(post_id: int, current_user_id: int | None = None) -> dict | None:
@@ -551,11 +625,10 @@ async def save_post_images(post_id: int, image_urls: list[str]) -> None:
     """게시글 이미지를 저장합니다. 기존 이미지를 모두 삭제하고 새 이미지를 순서대로 삽입합니다."""
     async with transactional() as cur:
         await cur.execute("DELETE FROM post_image WHERE post_id = %s", (post_id,))
-        for idx, url in enumerate(image_urls[:MAX_POST_IMAGES]):
-            await cur.execute(
-                "INSERT INTO post_image (post_id, image_url, sort_order) VALUES (%s, %s, %s)",
-                (post_id, url, idx),
-            )
+        rows = [(post_id, url, idx) for idx, url in enumerate(image_urls[:MAX_POST_IMAGES])]
+        if rows:
+            # executemany는 INSERT ... VALUES를 다중 행 INSERT 한 번으로 재작성
+            await cur.executemany(_INSERT_POST_IMAGE_SQL, rows)
 
 
 async def get_post_images(post_id: int) -> list[dict]:
@@ -565,7 +638,7 @@ async def get_post_images(post_id: int) -> list[dict]:
             "SELECT id, image_url, sort_order FROM post_image WHERE post_id = %s ORDER BY sort_order",
             (post_id,),
         )
-        return [dict(row) for row in await cur.fetchall()]
+        return list(await cur.fetchall())
 
 
 async def get_related_posts(
@@ -574,6 +647,7 @@ async def get_related_posts(
     tag_ids: list[int],
     limit: int = 5,
     blocked_user_ids: set[int] | None = None,
+    content_preview_len: int | None = None,
 ) -> list[dict]:
     """현재 게시글과 관련된 게시글을 태그/카테고리 기반으로 조회합니다."""
     where = "p.deleted_at IS NULL AND p.id != %s"
@@ -602,12 +676,13 @@ async def get_related_posts(
         cat_params = []
 
     params.extend([limit])
+    content_sql, content_params = _content_column_sql(content_preview_len)
 
     async with get_cursor() as cur:
         await cur.execute(
             f"""
                 SELECT
-                    p.id AS post_id, p.title, p.content, p.image_url,
+                    p.id AS post_id, p.title, {content_sql}, p.image_url,
                     p.views AS views_count,
                     p.created_at, p.updated_at,
                     u.id AS author_user_id, u.nickname AS author_nickname,
@@ -618,33 +693,18 @@ async def get_related_posts(
                     COALESCE(bk.cnt, 0) AS bookmarks_count,
                     {tag_select},
                     {same_category},
-                    {hot_score_sql()} AS hot_score
+                    {_HOT_SCORE_SQL} AS hot_score
                 FROM post p
                 LEFT JOIN user u ON p.author_id = u.id
                 LEFT JOIN category cat ON p.category_id = cat.id
                 {tag_join}
-                LEFT JOIN (
-                    SELECT post_id, COUNT(*) AS cnt
-                    FROM post_like
-                    GROUP BY post_id
-                ) likes ON p.id = likes.post_id
-                LEFT JOIN (
-                    SELECT post_id, COUNT(*) AS cnt
-                    FROM comment
-                    WHERE deleted_at IS NULL
-                    GROUP BY post_id
-                ) comments ON p.id = comments.post_id
-                LEFT JOIN (
-                    SELECT post_id, COUNT(*) AS cnt
-                    FROM post_bookmark
-                    GROUP BY post_id
-                ) bk ON p.id = bk.post_id
+                {_POST_COUNTS_JOIN_SQL}
                 WHERE {where}
                 GROUP BY p.id
                 ORDER BY matched_tags DESC, same_category DESC, hot_score DESC
                 LIMIT %s
                 """,
-            [*cat_params, *tag_params, *params],
+            [*content_params, *cat_params, *tag_params, *params],
         )
         rows = await cur.fetchall()
 
@@ -674,8 +734,6 @@ async def get_related_posts(
         ]
 
 
-# get_comments_with_author는 comment_models.py에서 정의됨 (상단 import 참조)
-# 하위 호환성을 위해 다시 내보내기
 __all__ = [
     "ALLOWED_POST_COLUMNS",
     "ALLOWED_SORT_OPTIONS",
@@ -684,7 +742,6 @@ __all__ = [
     "create_post",
     "delete_post",
     "get_comment_for_accept_validation",
-    "get_comments_with_author",
     "get_post_by_id",
     "get_post_images",
     "get_post_with_details",
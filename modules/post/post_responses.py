@@ -51,3 +51,4 @@ class PostListResult(BaseModel):
     total_count: int
     has_more: bool
     effective_sort: str | None = None
+    next_cursor: str | None = None
@@ -1,12 +1,20 @@
 """post_schemas: 게시글 관련 Pydantic 모델 모듈.
 
 게시글 생성, 수정 요청 스키마를 정의합니다.
+제목/내용 검증은 Annotated + AfterValidator 타입으로 생성/수정 요청이 공유합니다.
 """
 
-from pydantic import BaseModel, Field, field_validator
+from typing import Annotated
+
+from pydantic import AfterValidator, BaseModel, Field, field_validator
 
 from modules.post.poll_schemas import PollCreate
 from schemas._image_validators import validate_upload_image_url, validate_upload_image_url_list
+from schemas._text_validators import make_stripped_checker
+
+# 재사용 타입 — Field 제약 + AfterValidator를 한 곳에서 정의
+PostTitle = Annotated[str, Field(min_length=3, max_length=100), AfterValidator(make_stripped_checker("제목", 3))]
+PostContent = Annotated[str, Field(min_length=1, max_length=10000), AfterValidator(make_stripped_checker("내용", 1))]
 
 
 class CreatePostRequest(BaseModel):
@@ -19,8 +27,8 @@ class CreatePostRequest(BaseModel):
         category_id: 카테고리 ID (필수).
     """
 
-    title: str = Field(..., min_length=3, max_length=100)
-    content: str = Field(..., min_length=1, max_length=10000)
+    title: PostTitle
+    content: PostContent
     image_url: str | None = None
     image_urls: list[str] | None = None
     category_id: int = Field(..., ge=1)
@@ -50,44 +58,6 @@ class CreatePostRequest(BaseModel):
             raise ValueError("태그는 최대 5개까지 가능합니다.")
         return normalized if normalized else None
 
-    @field_validator("title")
-    @classmethod
-    def validate_title(cls, v: str) -> str:
-        """제목 형식을 검증합니다.
-
-        Args:
-            v: 입력된 제목.
-
-        Returns:
-            공백이 제거된 검증된 제목.
-
-        Raises:
-            ValueError: 제목이 3자 미만인 경우.
-        """
-        v = v.strip()
-        if len(v) < 3:
-            raise ValueError("제목은 최소 3자 이상이어야 합니다.")
-        return v
-
-    @field_validator("content")
-    @classmethod
-    def validate_content(cls, v: str) -> str:
-        """내용 형식을 검증합니다.
-
-        Args:
-            v: 입력된 내용.
-
-        Returns:
-            공백이 제거된 검증된 내용.
-
-        Raises:
-            ValueError: 내용이 1자 미만인 경우.
-        """
-        v = v.strip()
-        if len(v) < 1:
-            raise ValueError("내용은 최소 1자 이상이어야 합니다.")
-        return v
-
     @field_validator("image_url")
     @classmethod
     def validate_image_url(cls, v: str | None) -> str | None:
@@ -119,8 +89,8 @@ class UpdatePostRequest(BaseModel):
         content: 새 내용 (선택, 1~10000자).
     """
 
-    title: str | None = Field(None, min_length=3, max_length=100)
-    content: str | None = Field(None, min_length=1, max_length=10000)
+    title: PostTitle | None = None
+    content: PostContent | None = None
     image_url: str | None = None
     image_urls: list[str] | None = None
     category_id: int | None = Field(None, ge=1)
@@ -160,45 +130,3 @@ class UpdatePostRequest(BaseModel):
     def validate_image_urls(cls, v: list[str] | None) -> list[str] | None:
         """이미지 URL 리스트를 검증합니다."""
         return validate_upload_image_url_list(v)
-
-    @field_validator("title")
-    @classmethod
-    def validate_title(cls, v: str | None) -> str | None:
-        """제목 형식을 검증합니다.
-
-        Args:
-            v: 입력된 제목.
-
-        Returns:
-            공백이 제거된 검증된 제목 또는 None.
-
-        Raises:
-            ValueError: 제목이 3자 미만인 경우.
-        """
-        if v is None:
-            return None
-        v = v.strip()
-        if len(v) < 3:
-            raise ValueError("제목은 최소 3자 이상이어야 합니다.")
-        return v
-
-    @field_validator("content")
-    @classmethod
-    def validate_content(cls, v: str | None) -> str | None:
-        """내용 형식을 검증합니다.
-
-        Args:
-            v: 입력된 내용.
-
-        Returns:
-            공백이 제거된 검증된 내용 또는 None.
-
-        Raises:
-            ValueError: 내용이 1자 미만인 경우.
-        """
-        if v is None:
-            return None
-        v = v.strip()
-        if len(v) < 1:
-            raise ValueError("내용은 최소 1자 이상이어야 합니다.")
-        return v
@@ -1,17 +1,20 @@
 """post_service: 게시글 관련 비즈니스 로직을 처리하는 서비스."""
 
 import logging
+from datetime import datetime
 
+from core.utils import search_index
 from core.utils.error_codes import ErrorCode
 from core.utils.exceptions import bad_request_error, forbidden_error, not_found_error, safe_notify
 from core.utils.formatters import format_datetime
 from core.utils.mention import extract_mentions
+from core.utils.pagination import encode_cursor
 from modules.content import category_models, tag_models
 from modules.notification import models as notification_models
 from modules.notification.setting_models import get_muted_user_ids
-from modules.post import poll_models, post_models, subscription_models
+from modules.post import comment_models, poll_models, post_models, subscription_models
 from modules.post.bookmark_models import get_bookmark
-from modules.post.like_models import get_like
+from modules.post.like_service import LikeService
 from modules.post.post_responses import PostListResult
 from modules.post.post_schemas import CreatePostRequest
 from modules.user import follow_models
@@ -39,8 +42,12 @@ class PostService:
         tag: str | None = None,
         following: bool = False,
         solved: bool | None = None,
+        after: tuple[datetime, int] | None = None,
     ) -> PostListResult:
-        """게시글 목록 조회 및 가공."""
+        """게시글 목록 조회 및 가공.
+
+        after(keyset 커서)는 latest 정렬에서만 적용되며, 다른 정렬은 offset을 사용합니다.
+        """
         # 차단된 사용자 목록 조회
         blocked_ids: set[int] | None = None
         if current_user:
@@ -55,6 +62,17 @@ class PostService:
             if not author_ids:
                 return PostListResult(posts=[], total_count=0, has_more=False)
 
+        # 외부 검색 엔진: 후보 ID만 받아 MySQL에서 필터/정렬/페이지네이션
+        # (실패하거나 후보가 MAX_SEARCH_HITS에 닿으면 None — 목록/총 개수가 잘리지 않도록 FULLTEXT 폴백)
+        # 결과 순서는 FULLTEXT 경로와 같이 요청한 sort를 따름 — 검색 엔진은 매칭 여부만 판단
+        matched_ids: list[int] | None = None
+        if search and search_index.is_enabled():
+            matched_ids = await search_index.search_post_ids(search)
+            if matched_ids is not None:
+                if not matched_ids:
+                    return PostListResult(posts=[], total_count=0, has_more=False)
+                search = None
+
         # 추천 피드 cold start 처리
         effective_sort = sort
         if sort == "for_you":
@@ -69,6 +87,11 @@ class PostService:
         # 추천 피드: 다양성 필터 여유분 확보
         fetch_limit = limit * 3 if effective_sort == "for_you" else limit
 
+        # keyset 모드: 한 건 더 조회하여 다음 페이지 존재 여부 판단
+        use_keyset = after is not None and effective_sort == "latest"
+        if use_keyset:
+            fetch_limit = limit + 1
+
         # 1. DB 조회
         posts_data = await post_models.get_posts_with_details(
             offset,
@@ -82,6 +105,10 @@ class PostService:
             author_ids=author_ids,
             current_user_id=current_user.id if current_user else None,
             solved=solved,
+            after=after if use_keyset else None,
+            # 잘림 여부 판단을 위해 미리보기 길이보다 한 글자 더 조회
+            content_preview_len=POST_PREVIEW_LENGTH + 1,
+            post_ids=matched_ids,
         )
         total_count = await post_models.get_total_posts_count(
             search=search,
@@ -91,13 +118,25 @@ class PostService:
             tag=tag,
             author_ids=author_ids,
             solved=solved,
+            post_ids=matched_ids,
         )
 
         # 추천 피드 다양성 필터: 작성자당 최대 3개
         if effective_sort == "for_you":
             posts_data = PostService._apply_diversity_cap(posts_data, limit)
 
-        has_more = offset + limit < total_count
+        if use_keyset:
+            has_more = len(posts_data) > limit
+            posts_data = posts_data[:limit]
+        else:
+            has_more = offset + limit < total_count
+
+        # 다음 페이지 커서: 고정 게시글은 keyset 범위 밖이므로 마지막 일반 게시글 기준
+        next_cursor: str | None = None
+        if effective_sort == "latest" and has_more:
+            last = next((p for p in reversed(posts_data) if not p["is_pinned"]), None)
+            if last is not None:
+                next_cursor = encode_cursor(last["created_at"], last["post_id"])
 
         # 2. 데이터 가공 (날짜 포맷, 내용 요약)
         for post in posts_data:
@@ -128,6 +167,7 @@ class PostService:
             total_count=total_count,
             has_more=has_more,
             effective_sort=effective_sort if effective_sort != sort else None,
+            next_cursor=next_cursor,
         )
 
     @staticmethod
@@ -173,8 +213,7 @@ class PostService:
         # 3. 로그인 사용자 상태 플래그 + 차단 목록
         blocked_ids: set[int] | None = None
         if current_user:
-            like = await get_like(post_id, current_user.id)
-            post_data["is_liked"] = like is not None
+            post_data["is_liked"] = await LikeService.is_liked(post_id, current_user.id)
 
             bookmark = await get_bookmark(post_id, current_user.id)
             post_data["is_bookmarked"] = bookmark is not None
@@ -210,7 +249,7 @@ class PostService:
         )
 
         # 5. 댓글 목록 조회
-        comments_data = await post_models.get_comments_with_author(
+        comments_data = await comment_models.get_comments_with_author(
             post_id,
             current_user_id=current_user.id if current_user else None,
             blocked_user_ids=blocked_ids,
@@ -261,6 +300,8 @@ class PostService:
             category_id=post_data.category_id,
         )
 
+        search_index.enqueue_index_post(post.id, post.title, post.content)
+
         # 다중 이미지 저장
         image_list = post_data.image_urls or ([post_data.image_url] if post_data.image_url else [])
         if image_list:
@@ -396,6 +437,9 @@ class PostService:
         )
         assert updated_post is not None  # 게시글 존재는 위에서 검증됨
 
+        if title is not None or content is not None:
+            search_index.enqueue_index_post(updated_post.id, updated_post.title, updated_post.content)
+
         # 6. 새로 추가된 멘션 알림 — 닉네임 일괄 조회로 N+1 방지
         if content:
             new_mentions = set(extract_mentions(content)) - old_mentions
@@ -445,6 +489,7 @@ class PostService:
 
         # 3. DB 삭제
         await post_models.delete_post(post_id)
+        search_index.enqueue_remove_post(post_id)
 
     @staticmethod
     async def get_related_posts(
@@ -487,6 +532,7 @@ class PostService:
             tag_ids=tag_ids,
             limit=limit,
             blocked_user_ids=blocked_ids,
+            content_preview_len=POST_PREVIEW_LENGTH + 1,
         )
 
         # 5. 데이터 가공 (날짜 포맷, 내용 요약)
@@ -41,6 +41,7 @@ async def get_posts(
     tag: str | None = Query(default=None, description="태그 이름으로 필터링"),
     following: bool = Query(False, description="팔로우한 사용자의 게시글만 조회"),
     solved: bool | None = Query(None, description="해결 여부 필터링 (true: 해결됨, false: 미해결)"),
+    cursor: str | None = Query(None, max_length=200, description="다음 페이지 커서 (latest 정렬 전용)"),
     current_user: User | None = Depends(get_optional_user),
 ) -> dict:
     """게시글 목록을 조회합니다.
@@ -60,6 +61,7 @@ async def get_posts(
         category_id: 카테고리 ID로 필터링 (선택).
         tag: 태그명으로 필터링 (선택).
         following: True이면 팔로우한 사용자의 게시글만 조회 (로그인 필요, 비로그인 시 무시).
+        cursor: 이전 응답의 pagination.next_cursor (latest 정렬에서 offset 대신 keyset 조회).
 
     Returns:
         게시글 목록과 페이지네이션 정보가 포함된 응답.
@@ -76,6 +78,7 @@ async def get_posts(
         tag=tag,
         following=following,
         solved=solved,
+        cursor=cursor,
     )
 
 
@@ -2,6 +2,7 @@
 
 Public API — 다른 모듈에서 사용하는 심볼:
 - User (dataclass)
-- get_user_by_id, get_user_by_email
+- get_user_by_id, get_user_by_email, get_users_by_ids, get_nicknames_by_ids
+- get_user_loader (from loader, 요청 범위 사용자 조회 배처)
 - is_blocked (from block_models)
 """
@@ -0,0 +1,132 @@
+"""cache: 사용자 조회 Redis read-through 캐시 모듈.
+
+USER_CACHE_BACKEND=redis일 때만 동작하며, 기본값(none)에서는 모든 함수가 no-op입니다.
+인증 의존성이 매 요청 수행하는 ID 기반 사용자 조회를 `user:{id}` 키로 짧게(USER_CACHE_TTL_SECONDS) 캐싱합니다.
+
+사용자 행을 변경하는 모델 함수는 커밋 후 invalidate()를 호출합니다. 무효화와 동시에 진행 중이던
+조회가 이전 값을 다시 채우는 경우는 TTL 안에서만 남는 것을 허용합니다.
+비밀번호 해시는 저장하지 않습니다 — 캐시에서 복원한 User의 password는 항상 None입니다.
+모든 Redis 오류는 best-effort — 예외를 전파하지 않고 DB 조회로 폴백합니다.
+
+캐시 미스 시 같은 사용자에 대한 동시 DB 조회는 load_once()로 하나로 합칩니다 (백엔드와 무관하게 동작).
+"""
+
+import asyncio
+import dataclasses
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from core.config import settings
+
+if TYPE_CHECKING:
+    from modules.user.models import User
+
+logger = logging.getLogger(__name__)
+
+USER_CACHE_TTL_SECONDS = 60
+
+_DATETIME_FIELDS = ("suspended_until", "created_at", "updated_at", "deleted_at")
+
+# 사용자 ID별 진행 중인 DB 조회 (프로세스 범위)
+_inflight: dict[int, asyncio.Task["User | None"]] = {}
+
+
+def is_enabled() -> bool:
+    """사용자 캐시 사용 여부."""
+    return settings.USER_CACHE_BACKEND == "redis" and bool(settings.REDIS_URL)
+
+
+def _key(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+def _dump(user: "User") -> str:
+    data = dataclasses.asdict(user)
+    del data["password"]
+    for field in _DATETIME_FIELDS:
+        if data[field] is not None:
+            data[field] = data[field].isoformat()
+    return json.dumps(data, ensure_ascii=False)
+
+
+def _load(raw: str) -> "User":
+    from modules.user.models import User
+
+    data = json.loads(raw)
+    for field in _DATETIME_FIELDS:
+        if data[field] is not None:
+            data[field] = datetime.fromisoformat(data[field])
+    return User(password=None, **data)
+
+
+async def _redis():
+    from core.utils.redis_client import get_redis
+
+    return await get_redis(settings.REDIS_URL)
+
+
+async def get_many(user_ids: list[int]) -> dict[int, "User"]:
+    """캐시에 있는 사용자만 반환합니다. 비활성화 또는 Redis 오류 시 빈 dict."""
+    if not is_enabled() or not user_ids:
+        return {}
+    try:
+        redis = await _redis()
+        raws = await redis.mget([_key(user_id) for user_id in user_ids])
+        return {user_id: _load(raw) for user_id, raw in zip(user_ids, raws, strict=True) if raw is not None}
+    except Exception:
+        logger.warning("사용자 캐시 조회 실패 (best-effort)", exc_info=True)
+        return {}
+
+
+async def set_many(users: list["User"]) -> None:
+    """DB에서 조회한 사용자를 캐시에 저장합니다 (best-effort)."""
+    if not is_enabled() or not users:
+        return
+    try:
+        redis = await _redis()
+        async with redis.pipeline(transaction=False) as pipe:
+            for user in users:
+                pipe.setex(_key(user.id), USER_CACHE_TTL_SECONDS, _dump(user))
+            await pipe.execute()
+    except Exception:
+        logger.warning("사용자 캐시 저장 실패 (best-effort)", exc_info=True)
+
+
+async def load_once(user_id: int, load: Callable[[], Awaitable["User | None"]]) -> "User | None":
+    """같은 사용자에 대한 동시 조회를 한 번의 load() 호출로 합칩니다.
+
+    인기 작성자처럼 여러 요청이 동시에 같은 ID를 조회할 때 DB 조회가 몰리지 않도록 합니다.
+    한 호출자가 취소되어도 공유 조회는 취소되지 않습니다 (asyncio.shield).
+    """
+    task = _inflight.get(user_id)
+    if task is None:
+        task = asyncio.ensure_future(load())
+        _inflight[user_id] = task
+        task.add_done_callback(lambda done: _forget_inflight(user_id, done))
+    return await asyncio.shield(task)
+
+
+def _forget_inflight(user_id: int, task: asyncio.Task) -> None:
+    if _inflight.get(user_id) is task:
+        del _inflight[user_id]
+    if not task.cancelled():
+        # 모든 호출자가 취소된 경우에도 "exception was never retrieved" 경고를 남기지 않음
+        task.exception()
+
+
+async def invalidate(user_id: int) -> None:
+    """사용자 캐시를 무효화합니다. 사용자 행 변경 커밋 후 호출합니다 (best-effort).
+
+    진행 중인 조회도 버려서, 이후 호출이 변경 전에 시작된 조회 결과를 공유하지 않도록 합니다.
+    """
+    _inflight.pop(user_id, None)
+    if not is_enabled():
+        return
+    try:
+        redis = await _redis()
+        await redis.delete(_key(user_id))
+    except Exception:
+        logger.warning("사용자 캐시 무효화 실패 (user_id=%d, best-effort)", user_id, exc_info=True)
@@ -0,0 +1,69 @@
+"""loader: 요청 범위 사용자 조회 배처 모듈.
+
+같은 이벤트 루프 틱 안에서 요청된 사용자 ID를 모아 get_users_by_ids 한 번으로 조회합니다.
+같은 요청 안에서 같은 ID를 다시 조회하면 이전 결과를 재사용합니다.
+"""
+
+import asyncio
+
+from fastapi import Request
+
+from modules.user.models import User, get_users_by_ids
+
+# 한 번의 IN 쿼리에 담는 최대 ID 수
+_MAX_BATCH_SIZE = 100
+
+
+class UserLoader:
+    """사용자 ID 조회를 틱 단위로 모아 일괄 조회하는 DataLoader."""
+
+    def __init__(self, max_batch_size: int = _MAX_BATCH_SIZE) -> None:
+        self._max_batch_size = max_batch_size
+        self._futures: dict[int, asyncio.Future[User | None]] = {}
+        self._queue: list[int] = []
+        self._tasks: set[asyncio.Task] = set()
+
+    def load(self, user_id: int) -> asyncio.Future[User | None]:
+        """사용자를 조회합니다. 없거나 탈퇴한 사용자는 None."""
+        future = self._futures.get(user_id)
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._futures[user_id] = future
+        self._queue.append(user_id)
+        if len(self._queue) == 1:
+            # 현재 틱에서 대기 중인 다른 load() 호출을 모은 뒤 배치 실행
+            loop.call_soon(self._dispatch)
+        return future
+
+    async def load_many(self, user_ids: list[int]) -> list[User | None]:
+        """여러 사용자를 조회합니다. 결과는 입력 순서를 따릅니다."""
+        return list(await asyncio.gather(*(self.load(user_id) for user_id in user_ids)))
+
+    def _dispatch(self) -> None:
+        queue, self._queue = self._queue, []
+        for start in range(0, len(queue), self._max_batch_size):
+            task = asyncio.create_task(self._load_batch(queue[start : start + self._max_batch_size]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _load_batch(self, user_ids: list[int]) -> None:
+        try:
+            users = await get_users_by_ids(user_ids)
+        except Exception as exc:
+            for user_id in user_ids:
+                self._futures.pop(user_id).set_exception(exc)
+            return
+        for user_id in user_ids:
+            self._futures[user_id].set_result(users.get(user_id))
+
+
+def get_user_loader(request: Request) -> UserLoader:
+    """요청에 연결된 UserLoader를 반환합니다. 없으면 생성하여 request.state에 저장합니다."""
+    loader = getattr(request.state, "user_loader", None)
+    if loader is None:
+        loader = UserLoader()
+        request.state.user_loader = loader
+    return loader
@@ -3,25 +3,61 @@
 사용자 데이터 클래스와 MySQL 데이터베이스를 관리하는 함수들을 제공합니다.
 """
 
+import os
 import time
-import uuid
-from dataclasses import dataclass
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime
 
-from core.database.connection import get_cursor, transactional
+from core.database.connection import db_timestamp, get_cursor, transactional
+from core.utils.clock import utc_now
 from core.utils.pagination import escape_like
+from modules.user import cache as user_cache
+from schemas.common import DEFAULT_PROFILE_IMAGE
 
 
 def generate_temp_nickname() -> str:
     """임시 닉네임을 생성합니다 (tmp_ + 6자리)."""
-    return f"tmp_{uuid.uuid4().hex[:6]}"
+    return f"tmp_{os.urandom(3).hex()}"
 
 
-# SQL Injection 방지: 허용된 컬럼명 whitelist
-ALLOWED_USER_COLUMNS = {"nickname", "profile_img", "distro"}
+# iter_active_user_ids 배치 크기
+_ACTIVE_USER_IDS_BATCH_SIZE = 500
 
+# update_user의 distro 갱신 방식
+_DISTRO_UNCHANGED, _DISTRO_CLEAR, _DISTRO_SET = range(3)
 
-@dataclass(frozen=True)
+
+def _build_update_user_sql() -> dict[tuple[bool, bool, int], str]:
+    """갱신 필드 조합별 UPDATE 문을 미리 만들어 둡니다.
+
+    컬럼명은 고정 문자열만 사용하므로 호출 시 문자열 조립이나 컬럼명 검증이 필요 없습니다.
+    변경할 필드가 없는 조합은 테이블에 넣지 않습니다.
+    """
+    table = {}
+    for nickname in (False, True):
+        for profile_img in (False, True):
+            for distro_mode in (_DISTRO_UNCHANGED, _DISTRO_CLEAR, _DISTRO_SET):
+                updates = []
+                if nickname:
+                    updates.append("nickname = %s")
+                if profile_img:
+                    updates.append("profile_img = %s")
+                if distro_mode == _DISTRO_CLEAR:
+                    updates.append("distro = NULL")
+                elif distro_mode == _DISTRO_SET:
+                    updates.append("distro = %s")
+                if updates:
+                    table[(nickname, profile_img, distro_mode)] = (
+                        f"UPDATE user SET {', '.join(updates)} WHERE id = %s AND deleted_at IS NULL"
+                    )
+    return table
+
+
+_UPDATE_USER_SQL = _build_update_user_sql()
+
+
+@dataclass(frozen=True, slots=True)
 class User:
     """사용자 데이터 클래스."""
 
@@ -58,82 +94,87 @@ class User:
         suspended = self.suspended_until
         if suspended.tzinfo is None:
             suspended = suspended.replace(tzinfo=UTC)
-        return suspended > datetime.now(UTC)
+        return suspended > utc_now()
 
     @property
     def profileImageUrl(self) -> str:
         """프로필 이미지 URL을 반환합니다 (하위 호환성)."""
-        return self.profile_image_url or "/assets/profiles/default_profile.jpg"
+        return self.profile_image_url or DEFAULT_PROFILE_IMAGE
 
 
 # DB 컬럼 → dataclass 필드 매핑을 위한 SELECT (profile_img AS profile_image_url)
+# 컬럼 순서는 User 필드 순서와 같아야 함 — _row_to_user가 튜플을 위치 기반으로 펼침
 USER_SELECT_FIELDS = (
-    "id, email, email_verified, nickname, nickname_set, password, "
+    "id, email, password, nickname, email_verified, nickname_set, "
     "profile_img AS profile_image_url, role, "
     "suspended_until, suspended_reason, created_at, updated_at, deleted_at, distro"
 )
 
 
-def _row_to_user(row: dict) -> User:
-    """DictCursor 결과를 User 객체로 변환합니다. bool 변환을 보장합니다."""
-    return User(
-        id=row["id"],
-        email=row["email"],
-        email_verified=bool(row["email_verified"]),
-        nickname=row["nickname"],
-        nickname_set=bool(row["nickname_set"]),
-        password=row["password"],
-        profile_image_url=row["profile_image_url"],
-        role=row["role"],
-        suspended_until=row["suspended_until"],
-        suspended_reason=row["suspended_reason"],
-        created_at=row["created_at"],
-        updated_at=row["updated_at"],
-        deleted_at=row["deleted_at"],
-        distro=row["distro"],
-    )
+# ID 기반 조회(인증 의존성, 사용자 캐시 경로)는 비밀번호 해시를 싣지 않음 (password=None)
+# 해시가 필요한 비밀번호 변경/탈퇴는 get_password_hash()로 DB에서 직접 조회
+_USER_FIELDS_NO_PASSWORD = USER_SELECT_FIELDS.replace("password", "NULL AS password", 1)
+
+# 자주 쓰는 단건 조회 SQL — 모듈 로드 시 한 번만 조립
+_SELECT_USER_BY_ID_SQL = f"SELECT {_USER_FIELDS_NO_PASSWORD} FROM user WHERE id = %s AND deleted_at IS NULL"
+_SELECT_USER_BY_EMAIL_SQL = f"SELECT {USER_SELECT_FIELDS} FROM user WHERE email = %s AND deleted_at IS NULL"
+_SELECT_USER_BY_NICKNAME_SQL = f"SELECT {USER_SELECT_FIELDS} FROM user WHERE nickname = %s AND deleted_at IS NULL"
+# 변경 직후 재조회 (탈퇴 여부와 무관하게 같은 트랜잭션에서 방금 갱신한 행)
+_SELECT_UPDATED_USER_SQL = f"SELECT {USER_SELECT_FIELDS} FROM user WHERE id = %s"
+
+
+def _row_to_user(row: tuple) -> User:
+    """튜플 커서 결과(USER_SELECT_FIELDS 순서)를 User 객체로 변환합니다. bool 변환을 보장합니다."""
+    user_id, email, password, nickname, email_verified, nickname_set, *rest = row
+    return User(user_id, email, password, nickname, bool(email_verified), bool(nickname_set), *rest)
 
 
 async def get_user_by_id(user_id: int) -> User | None:
-    """ID로 사용자를 조회합니다."""
-    async with get_cursor() as cur:
-        await cur.execute(
-            f"SELECT {USER_SELECT_FIELDS} FROM user WHERE id = %s AND deleted_at IS NULL",
-            (user_id,),
-        )
+    """ID로 사용자를 조회합니다. 반환값의 password는 항상 None입니다 (get_password_hash 참고).
+
+    사용자 캐시가 활성화되어 있으면 캐시를 먼저 확인하고, 같은 ID의 동시 DB 조회는 하나로 합칩니다.
+    """
+    cached = await user_cache.get_many([user_id])
+    if user_id in cached:
+        return cached[user_id]
+    return await user_cache.load_once(user_id, lambda: _load_user_by_id(user_id))
+
+
+async def _load_user_by_id(user_id: int) -> User | None:
+    async with get_cursor(as_tuple=True) as cur:
+        await cur.execute(_SELECT_USER_BY_ID_SQL, (user_id,))
         row = await cur.fetchone()
-        return _row_to_user(row) if row else None
 
+    if not row:
+        return None
+    user = _row_to_user(row)
+    await user_cache.set_many([user])
+    return user
 
-async def get_user_by_email(email: str) -> User | None:
-    """이메일로 사용자를 조회합니다."""
-    async with get_cursor() as cur:
-        await cur.execute(
-            f"SELECT {USER_SELECT_FIELDS} FROM user WHERE email = %s AND deleted_at IS NULL",
-            (email,),
-        )
+
+async def get_password_hash(user_id: int) -> str | None:
+    """활성 사용자의 비밀번호 해시를 조회합니다. 소셜 전용 계정(password=NULL)이면 None을 반환합니다.
+
+    사용자 캐시를 거치지 않습니다 — 해시는 Redis에 저장하지 않음.
+    """
+    async with get_cursor(as_tuple=True) as cur:
+        await cur.execute("SELECT password FROM user WHERE id = %s AND deleted_at IS NULL", (user_id,))
         row = await cur.fetchone()
-        return _row_to_user(row) if row else None
+        return row[0] if row else None
 
 
-async def get_deleted_user_by_email(email: str) -> User | None:
-    """이메일로 탈퇴한 사용자를 조회합니다."""
-    async with get_cursor() as cur:
-        await cur.execute(
-            f"SELECT {USER_SELECT_FIELDS} FROM user WHERE email = %s AND deleted_at IS NOT NULL",
-            (email,),
-        )
+async def get_user_by_email(email: str) -> User | None:
+    """이메일로 사용자를 조회합니다."""
+    async with get_cursor(as_tuple=True) as cur:
+        await cur.execute(_SELECT_USER_BY_EMAIL_SQL, (email,))
         row = await cur.fetchone()
         return _row_to_user(row) if row else None
 
 
 async def get_user_by_nickname(nickname: str) -> User | None:
     """닉네임으로 사용자를 조회합니다."""
-    async with get_cursor() as cur:
-        await cur.execute(
-            f"SELECT {USER_SELECT_FIELDS} FROM user WHERE nickname = %s AND deleted_at IS NULL",
-            (nickname,),
-        )
+    async with get_cursor(as_tuple=True) as cur:
+        await cur.execute(_SELECT_USER_BY_NICKNAME_SQL, (nickname,))
         row = await cur.fetchone()
         return _row_to_user(row) if row else None
 
@@ -144,14 +185,80 @@ async def get_users_by_nicknames(nicknames: list[str]) -> dict[str, "User"]:
         return {}
 
     placeholders = ", ".join(["%s"] * len(nicknames))
-    async with get_cursor() as cur:
+    async with get_cursor(as_tuple=True) as cur:
         await cur.execute(
             f"SELECT {USER_SELECT_FIELDS} FROM user WHERE nickname IN ({placeholders}) AND deleted_at IS NULL",
             nicknames,
         )
         rows = await cur.fetchall()
 
-    return {row["nickname"]: _row_to_user(row) for row in rows}
+    users = [_row_to_user(row) for row in rows]
+    return {user.nickname: user for user in users}
+
+
+async def get_users_by_ids(user_ids: list[int]) -> dict[int, "User"]:
+    """ID 목록으로 사용자를 일괄 조회합니다. 개별 get_user_by_id 호출을 단일 IN 쿼리로 대체합니다.
+
+    get_user_by_id와 마찬가지로 password는 항상 None입니다.
+
+    사용자 캐시가 활성화되어 있으면 캐시에 없는 ID만 DB에서 조회합니다.
+    """
+    if not user_ids:
+        return {}
+
+    users = await user_cache.get_many(user_ids)
+    missing = [user_id for user_id in user_ids if user_id not in users]
+    if not missing:
+        return users
+
+    placeholders = ", ".join(["%s"] * len(missing))
+    async with get_cursor(as_tuple=True) as cur:
+        await cur.execute(
+            f"SELECT {_USER_FIELDS_NO_PASSWORD} FROM user WHERE id IN ({placeholders}) AND deleted_at IS NULL",
+            missing,
+        )
+        rows = await cur.fetchall()
+
+    loaded = [_row_to_user(row) for row in rows]
+    await user_cache.set_many(loaded)
+    users.update((user.id, user) for user in loaded)
+    return users
+
+
+async def get_nicknames_by_ids(user_ids: list[int]) -> dict[int, str]:
+    """ID 목록으로 닉네임만 일괄 조회합니다. 작성자/행위자 이름만 필요한 경우 전체 User 조회를 피합니다."""
+    if not user_ids:
+        return {}
+
+    placeholders = ", ".join(["%s"] * len(user_ids))
+    async with get_cursor(as_tuple=True) as cur:
+        await cur.execute(
+            f"SELECT id, nickname FROM user WHERE id IN ({placeholders}) AND deleted_at IS NULL",
+            user_ids,
+        )
+        return dict(await cur.fetchall())
+
+
+async def iter_active_user_ids(batch_size: int = _ACTIVE_USER_IDS_BATCH_SIZE) -> AsyncIterator[int]:
+    """탈퇴하지 않은 사용자 ID를 id 순 keyset 배치로 순회합니다.
+
+    전체 사용자를 한 번에 메모리에 올리지 않고, 배치 사이에는 연결을 반환하므로
+    사용자별 처리가 오래 걸려도 결과셋을 열어 둔 채 연결을 점유하지 않습니다.
+    """
+    last_id = 0
+    while True:
+        async with get_cursor(as_tuple=True) as cur:
+            await cur.execute(
+                "SELECT id FROM user WHERE deleted_at IS NULL AND id > %s ORDER BY id LIMIT %s",
+                (last_id, batch_size),
+            )
+            rows = await cur.fetchall()
+
+        for (user_id,) in rows:
+            yield user_id
+        if len(rows) < batch_size:
+            return
+        last_id = rows[-1][0]
 
 
 async def search_users_by_nickname(query: str, exclude_user_ids: set[int], limit: int = 10) -> list[dict]:
@@ -181,8 +288,6 @@ async def search_users_by_nickname(query: str, exclude_user_ids: set[int], limit
         await cur.execute(sql, params)
         rows = await cur.fetchall()
 
-    from schemas.common import DEFAULT_PROFILE_IMAGE
-
     return [
         {
             "user_id": row["id"],
@@ -226,24 +331,16 @@ async def get_user_email_by_nickname(nickname: str) -> str | None:
         return row["email"] if row else None
 
 
-async def get_deleted_user_by_nickname(nickname: str) -> User | None:
-    """닉네임으로 탈퇴한 사용자를 조회합니다."""
-    async with get_cursor() as cur:
-        await cur.execute(
-            f"SELECT {USER_SELECT_FIELDS} FROM user WHERE nickname = %s AND deleted_at IS NOT NULL",
-            (nickname,),
-        )
-        row = await cur.fetchone()
-        return _row_to_user(row) if row else None
-
-
 async def add_user(
     email: str,
     password: str,
     nickname: str,
     profile_image_url: str | None = None,
 ) -> User:
-    """새 사용자를 추가합니다."""
+    """새 사용자를 추가합니다.
+
+    삽입 직후 재조회 없이 입력값과 lastrowid, 컬럼 기본값으로 User를 구성합니다.
+    """
     async with transactional() as cur:
         await cur.execute(
             "INSERT INTO user (email, password, nickname, profile_img, terms_agreed_at) VALUES (%s, %s, %s, %s, NOW())",
@@ -251,14 +348,14 @@ async def add_user(
         )
         user_id = cur.lastrowid
 
-        await cur.execute(
-            f"SELECT {USER_SELECT_FIELDS} FROM user WHERE id = %s",
-            (user_id,),
-        )
-        row = await cur.fetchone()
-        if not row:
-            raise RuntimeError(f"User 생성 직후 조회 실패: user_id={user_id}")
-        return _row_to_user(row)
+    return User(
+        id=user_id,
+        email=email,
+        password=password,
+        nickname=nickname,
+        profile_image_url=profile_image_url,
+        created_at=db_timestamp(),
+    )
 
 
 async def update_user(
@@ -266,90 +363,90 @@ async def update_user(
     nickname: str | None = None,
     profile_image_url: str | None = None,
     distro: str | None = None,
+    current: User | None = None,
 ) -> User | None:
-    """사용자 정보를 업데이트합니다."""
-    updates = []
-    params = []
-
-    if nickname is not None:
-        updates.append("nickname = %s")
-        params.append(nickname)
-    if profile_image_url is not None:
-        updates.append("profile_img = %s")
-        params.append(profile_image_url)
-    if distro is not None:
-        if distro == "":
-            updates.append("distro = NULL")
-        else:
-            updates.append("distro = %s")
-            params.append(distro)
-
-    if not updates:
+    """사용자 정보를 업데이트합니다.
+
+    distro가 빈 문자열이면 NULL로 초기화합니다.
+    current(같은 요청에서 이미 조회한 갱신 전 사용자)를 넘기면 재조회 없이 변경 필드를 반영하여 반환합니다.
+    """
+    distro_mode = _DISTRO_UNCHANGED if distro is None else _DISTRO_CLEAR if distro == "" else _DISTRO_SET
+    update_sql = _UPDATE_USER_SQL.get((nickname is not None, profile_image_url is not None, distro_mode))
+    if update_sql is None:
         return await get_user_by_id(user_id)
 
-    # SQL Injection 방지: 컬럼명 검증
-    for update_clause in updates:
-        column_name = update_clause.split(" = ")[0]
-        if column_name not in ALLOWED_USER_COLUMNS:
-            raise ValueError(f"Invalid column name: {column_name}")
+    distro_param = distro if distro_mode == _DISTRO_SET else None
+    params = [value for value in (nickname, profile_image_url, distro_param) if value is not None]
 
-    async with transactional() as cur:
-        await cur.execute(
-            f"UPDATE user SET {', '.join(updates)} WHERE id = %s AND deleted_at IS NULL",
-            (*params, user_id),
-        )
+    async with transactional(as_tuple=True) as cur:
+        await cur.execute(update_sql, (*params, user_id))
 
         if cur.rowcount == 0:
             return None
 
-        await cur.execute(
-            f"SELECT {USER_SELECT_FIELDS} FROM user WHERE id = %s",
-            (user_id,),
-        )
-        row = await cur.fetchone()
+        row = None
+        if current is None:
+            await cur.execute(_SELECT_UPDATED_USER_SQL, (user_id,))
+            row = await cur.fetchone()
+
+    await user_cache.invalidate(user_id)
+    if current is None:
         return _row_to_user(row) if row else None
 
+    changes: dict = {"updated_at": db_timestamp()}
+    if nickname is not None:
+        changes["nickname"] = nickname
+    if profile_image_url is not None:
+        changes["profile_image_url"] = profile_image_url
+    if distro_mode != _DISTRO_UNCHANGED:
+        changes["distro"] = distro_param
+    return replace(current, **changes)
+
 
-async def update_password(user_id: int, new_password: str) -> User | None:
-    """사용자 비밀번호를 업데이트합니다."""
+async def update_password(user_id: int, new_password: str) -> bool:
+    """사용자 비밀번호를 업데이트합니다. 갱신된 행이 없으면 False를 반환합니다."""
     async with transactional() as cur:
         await cur.execute(
             "UPDATE user SET password = %s WHERE id = %s AND deleted_at IS NULL",
             (new_password, user_id),
         )
+        updated = cur.rowcount > 0
 
-        if cur.rowcount == 0:
-            return None
-
-        await cur.execute(
-            f"SELECT {USER_SELECT_FIELDS} FROM user WHERE id = %s",
-            (user_id,),
-        )
-        row = await cur.fetchone()
-        return _row_to_user(row) if row else None
+    if updated:
+        await user_cache.invalidate(user_id)
+    return updated
 
 
 def _generate_anonymized_user_data() -> tuple[str, str]:
     """익명화된 이메일과 닉네임을 생성합니다."""
-    unique_id = str(uuid.uuid4())
+    # UUID 객체 생성/포맷 없이 난수 바이트만 hex로 사용 (128비트)
+    unique_id = os.urandom(16).hex()
     timestamp = int(time.time())
     anonymized_nickname = f"deleted_{unique_id[:8]}"
     anonymized_email = f"deleted_{unique_id}_{timestamp}@deleted.user"
     return anonymized_email, anonymized_nickname
 
 
-async def _disconnect_and_anonymize_user(cur, user_id: int, *, set_deleted_at: bool = False) -> User | None:
-    """사용자의 연결을 끊고 익명화하는 공통 로직."""
-    anonymized_email, anonymized_nickname = _generate_anonymized_user_data()
-
-    # 1. 연결 끊기: 게시글과 댓글의 author_id를 NULL로 설정
-    await cur.execute("UPDATE post SET author_id = NULL WHERE author_id = %s", (user_id,))
-    await cur.execute("UPDATE comment SET author_id = NULL WHERE author_id = %s", (user_id,))
+# 탈퇴 사용자의 연결 끊기 — 게시글/댓글 작성자 NULL 처리, 리프레시 토큰 삭제
+_DISCONNECT_USER_SQLS = (
+    "UPDATE post SET author_id = NULL WHERE author_id = %s",
+    "UPDATE comment SET author_id = NULL WHERE author_id = %s",
+    "DELETE FROM refresh_token WHERE user_id = %s",
+)
 
-    # 2. 토큰 무효화: 모든 리프레시 토큰 삭제
-    await cur.execute("DELETE FROM refresh_token WHERE user_id = %s", (user_id,))
 
-    # 3. 사용자 익명화
+async def _anonymize_user(
+    cur,
+    user_id: int,
+    anonymized: tuple[str, str],
+    *,
+    set_deleted_at: bool,
+) -> bool:
+    """사용자 이메일/닉네임을 익명화합니다. 대상 사용자가 있었는지 반환합니다.
+
+    익명 값은 호출자가 트랜잭션을 열기 전에 만들어 전달합니다 — 행 잠금을 잡은 채 Python 작업을 하지 않음.
+    """
+    anonymized_email, anonymized_nickname = anonymized
     if set_deleted_at:
         await cur.execute(
             "UPDATE user SET deleted_at = NOW(), email = %s, nickname = %s WHERE id = %s AND deleted_at IS NULL",
@@ -360,39 +457,67 @@ async def _disconnect_and_anonymize_user(cur, user_id: int, *, set_deleted_at: b
             "UPDATE user SET email = %s, nickname = %s WHERE id = %s AND deleted_at IS NOT NULL",
             (anonymized_email, anonymized_nickname, user_id),
         )
+    return cur.rowcount > 0
 
-    if cur.rowcount == 0:
-        return None
 
-    await cur.execute(f"SELECT {USER_SELECT_FIELDS} FROM user WHERE id = %s", (user_id,))
-    row = await cur.fetchone()
-    return _row_to_user(row) if row else None
+async def withdraw_user(user_id: int) -> bool:
+    """회원 탈퇴를 처리합니다. 소프트 삭제를 수행하며, 재가입을 위해 이메일과 닉네임을 익명화합니다.
 
+    익명화와 연결 끊기를 한 트랜잭션으로 수행합니다. 사용자 익명화를 먼저 수행하여
+    대상이 없으면 연결 끊기 쿼리를 보내지 않고, 호출자가 결과 행을 쓰지 않으므로 재조회하지 않습니다.
 
-async def withdraw_user(user_id: int) -> User | None:
-    """회원 탈퇴를 처리합니다. 소프트 삭제를 수행하며, 재가입을 위해 이메일과 닉네임을 익명화합니다."""
+    Returns:
+        탈퇴 처리 여부 (이미 탈퇴했거나 없는 사용자면 False).
+    """
+    anonymized = _generate_anonymized_user_data()
     async with transactional() as cur:
-        return await _disconnect_and_anonymize_user(cur, user_id, set_deleted_at=True)
+        withdrawn = await _anonymize_user(cur, user_id, anonymized, set_deleted_at=True)
+        if withdrawn:
+            for sql in _DISCONNECT_USER_SQLS:
+                await cur.execute(sql, (user_id,))
+    await user_cache.invalidate(user_id)
+    return withdrawn
 
 
-async def cleanup_deleted_user(user_id: int) -> User | None:
-    """이미 탈퇴 처리되었으나 정보가 남아있는 사용자(Zombie)를 완전 익명화합니다."""
-    async with transactional() as cur:
-        return await _disconnect_and_anonymize_user(cur, user_id, set_deleted_at=False)
+async def cleanup_deleted_user(user_id: int) -> bool:
+    """이미 탈퇴 처리되었으나 정보가 남아있는 사용자(Zombie)를 완전 익명화합니다.
 
+    withdraw_user와 같이 익명화와 연결 끊기를 한 트랜잭션으로 수행합니다.
 
-async def update_nickname_set(user_id: int, nickname: str) -> User | None:
-    """닉네임을 설정하고 nickname_set=1로 변경합니다."""
+    Returns:
+        익명화 여부 (탈퇴하지 않았거나 없는 사용자면 False).
+    """
+    anonymized = _generate_anonymized_user_data()
     async with transactional() as cur:
+        cleaned = await _anonymize_user(cur, user_id, anonymized, set_deleted_at=False)
+        if cleaned:
+            for sql in _DISCONNECT_USER_SQLS:
+                await cur.execute(sql, (user_id,))
+    await user_cache.invalidate(user_id)
+    return cleaned
+
+
+async def update_nickname_set(user_id: int, nickname: str, current: User | None = None) -> User | None:
+    """닉네임을 설정하고 nickname_set=1로 변경합니다.
+
+    current(같은 요청에서 이미 조회한 갱신 전 사용자)를 넘기면 재조회 없이 변경 필드를 반영하여 반환합니다.
+    """
+    async with transactional(as_tuple=True) as cur:
         await cur.execute(
             "UPDATE user SET nickname = %s, nickname_set = 1 WHERE id = %s AND deleted_at IS NULL",
             (nickname, user_id),
         )
         if cur.rowcount == 0:
             return None
-        await cur.execute(f"SELECT {USER_SELECT_FIELDS} FROM user WHERE id = %s", (user_id,))
-        row = await cur.fetchone()
+        row = None
+        if current is None:
+            await cur.execute(_SELECT_UPDATED_USER_SQL, (user_id,))
+            row = await cur.fetchone()
+
+    await user_cache.invalidate(user_id)
+    if current is None:
         return _row_to_user(row) if row else None
+    return replace(current, nickname=nickname, nickname_set=True, updated_at=db_timestamp())
 
 
 async def add_social_user(
@@ -400,7 +525,10 @@ async def add_social_user(
     nickname: str,
     profile_image_url: str | None = None,
 ) -> User:
-    """소셜 로그인으로 사용자를 생성합니다 (password=NULL, email_verified=1, nickname_set=0)."""
+    """소셜 로그인으로 사용자를 생성합니다 (password=NULL, email_verified=1, nickname_set=0).
+
+    삽입 직후 재조회 없이 입력값과 lastrowid, 컬럼 기본값으로 User를 구성합니다.
+    """
     async with transactional() as cur:
         await cur.execute(
             "INSERT INTO user (email, password, nickname, nickname_set, email_verified, profile_img, terms_agreed_at) "
@@ -408,11 +536,44 @@ async def add_social_user(
             (email, nickname, profile_image_url),
         )
         user_id = cur.lastrowid
-        await cur.execute(f"SELECT {USER_SELECT_FIELDS} FROM user WHERE id = %s", (user_id,))
-        row = await cur.fetchone()
-        if not row:
-            raise RuntimeError(f"User 생성 직후 조회 실패: user_id={user_id}")
-        return _row_to_user(row)
+
+    return User(
+        id=user_id,
+        email=email,  # type: ignore[arg-type]  # 이메일 미제공 소셜 계정은 NULL
+        password=None,
+        nickname=nickname,
+        email_verified=True,
+        nickname_set=False,
+        profile_image_url=profile_image_url,
+        created_at=db_timestamp(),
+    )
+
+
+async def _cleanup_conflicting_deleted_users(email: str, nickname: str) -> bool:
+    """이메일 또는 닉네임을 점유한 탈퇴 사용자(Zombie)를 행 잠금 아래에서 다시 확인하고 모두 익명화합니다.
+
+    FOR UPDATE로 잠근 뒤 익명화와 연결 끊기를 같은 트랜잭션에서 수행하므로, 같은 이메일/닉네임으로
+    동시에 가입하는 요청은 잠금이 풀린 뒤 이미 익명화된 행을 보지 못하고 False를 받습니다.
+
+    Returns:
+        익명화한 사용자가 있었는지 여부.
+    """
+    # 이메일/닉네임은 각각 UNIQUE이므로 충돌 행은 최대 2개 — 익명 값은 트랜잭션 밖에서 미리 생성
+    anonymized = (_generate_anonymized_user_data(), _generate_anonymized_user_data())
+    async with transactional(as_tuple=True) as cur:
+        await cur.execute(
+            "SELECT id FROM user WHERE (email = %s OR nickname = %s) AND deleted_at IS NOT NULL FOR UPDATE",
+            (email, nickname),
+        )
+        zombie_ids = [user_id for (user_id,) in await cur.fetchall()]
+        for user_id, values in zip(zombie_ids, anonymized, strict=False):
+            await _anonymize_user(cur, user_id, values, set_deleted_at=False)
+            for sql in _DISCONNECT_USER_SQLS:
+                await cur.execute(sql, (user_id,))
+
+    for user_id in zombie_ids:
+        await user_cache.invalidate(user_id)
+    return bool(zombie_ids)
 
 
 async def register_user(
@@ -421,27 +582,22 @@ async def register_user(
     nickname: str,
     profile_image_url: str | None = None,
 ) -> User:
-    """새 사용자를 등록합니다 (중복 처리 및 Zombie 사용자 정리 포함)."""
+    """새 사용자를 등록합니다 (중복 처리 및 Zombie 사용자 정리 포함).
+
+    중복 키 오류 시 이메일/닉네임을 점유한 탈퇴 사용자를 잠금 아래에서 한 번에 조회하여 모두 익명화한 뒤
+    한 번만 재시도합니다 — 이메일과 닉네임을 서로 다른 탈퇴 사용자가 점유한 경우도 처리합니다.
+    """
     from pymysql.err import IntegrityError
 
     try:
         return await add_user(email, password, nickname, profile_image_url)
     except IntegrityError as e:
-        if e.args[0] == 1062:
-            deleted_user_email = await get_deleted_user_by_email(email)
-            if deleted_user_email:
-                await cleanup_deleted_user(deleted_user_email.id)
-                try:
-                    return await add_user(email, password, nickname, profile_image_url)
-                except IntegrityError:
-                    raise IntegrityError(1062, f"Duplicate entry for email='{email}'") from None
-
-            deleted_user_nick = await get_deleted_user_by_nickname(nickname)
-            if deleted_user_nick:
-                await cleanup_deleted_user(deleted_user_nick.id)
-                try:
-                    return await add_user(email, password, nickname, profile_image_url)
-                except IntegrityError:
-                    raise IntegrityError(1062, f"Duplicate entry for nickname='{nickname}'") from None
-
-        raise e
+        if e.args[0] != 1062:
+            raise
+        if not await _cleanup_conflicting_deleted_users(email, nickname):
+            raise
+
+    try:
+        return await add_user(email, password, nickname, profile_image_url)
+    except IntegrityError:
+        raise IntegrityError(1062, f"Duplicate entry for email='{email}' or nickname='{nickname}'") from None
@@ -10,6 +10,7 @@ from typing import Annotated, Literal, get_args
 from pydantic import AfterValidator, BaseModel, EmailStr, Field, field_validator
 
 from schemas._image_validators import validate_profile_image_url
+from schemas.common import DEFAULT_PROFILE_IMAGE
 
 # Literal 타입으로 허용 배포판을 정의 — Pydantic v2 네이티브 검증 활용
 Distro = Literal[
@@ -70,7 +71,7 @@ class CreateUserRequest(BaseModel):
     email: EmailStr
     password: Password
     nickname: Nickname
-    profileImageUrl: str | None = "/assets/profiles/default_profile.jpg"
+    profileImageUrl: str | None = DEFAULT_PROFILE_IMAGE
     terms_agreed: bool
 
     @field_validator("terms_agreed")
@@ -86,9 +87,9 @@ class CreateUserRequest(BaseModel):
     def validate_profile_image(cls, v: str | None) -> str:
         """프로필 이미지 URL 형식을 검증합니다."""
         if v is None:
-            return "/assets/profiles/default_profile.jpg"
+            return DEFAULT_PROFILE_IMAGE
         result = validate_profile_image_url(v)
-        return result if result is not None else "/assets/profiles/default_profile.jpg"
+        return result if result is not None else DEFAULT_PROFILE_IMAGE
 
 
 class UpdateUserRequest(BaseModel):
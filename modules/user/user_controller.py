@@ -196,7 +196,9 @@ async def change_password(password_data: ChangePasswordRequest, current_user: Us
     timestamp = get_request_timestamp(request)
 
     # 소셜 로그인 계정은 password 필드가 NULL — 비밀번호가 없으므로 변경 자체가 불가능
-    if current_user.password is None:
+    # current_user(ID 기반 조회/캐시)에는 해시가 없으므로 DB에서 직접 조회
+    stored_password_hash = await user_models.get_password_hash(current_user.id)
+    if stored_password_hash is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={
@@ -213,7 +215,7 @@ async def change_password(password_data: ChangePasswordRequest, current_user: Us
         new_password=password_data.new_password,
         new_password_confirm=password_data.new_password_confirm,
         # 현재 비밀번호 검증을 Service에서 수행하므로 해시값을 그대로 전달
-        stored_password_hash=current_user.password,
+        stored_password_hash=stored_password_hash,
         timestamp=timestamp,
     )
 
@@ -1,6 +1,5 @@
 """user_service: 사용자 관련 비즈니스 로직을 처리하는 서비스."""
 
-import asyncio
 import logging
 
 from core.config import settings
@@ -11,7 +10,7 @@ from core.utils.exceptions import (
     conflict_error,
     not_found_error,
 )
-from core.utils.password import hash_password, verify_password
+from core.utils.password import hash_password_async, verify_password_async
 from core.utils.temp_password import generate_temp_password
 from modules.auth import verification_models
 from modules.user import models as user_models
@@ -44,7 +43,7 @@ class UserService:
             raise conflict_error(ErrorCode.NICKNAME_ALREADY_EXISTS, timestamp, "이미 사용 중인 닉네임입니다")
 
         # 3. 비밀번호 해싱
-        hashed_password = await asyncio.to_thread(hash_password, user_data.password)
+        hashed_password = await hash_password_async(user_data.password)
 
         try:
             # 4. 사용자 생성 시도 (좀비 사용자 처리 로직 포함)
@@ -116,6 +115,7 @@ class UserService:
             nickname=nickname,
             profile_image_url=profile_image_url,
             distro=distro,
+            current=current_user,
         )
 
         # update_user는 변경사항이 없으면 None을 반환할 수 있음 (실제 DB 업데이트 0건)
@@ -151,7 +151,7 @@ class UserService:
     ) -> None:
         """비밀번호 변경."""
         # 1. 현재 비밀번호 확인
-        if not await asyncio.to_thread(verify_password, current_password, stored_password_hash):
+        if not await verify_password_async(current_password, stored_password_hash):
             raise bad_request_error(ErrorCode.INVALID_PASSWORD, timestamp)
 
         # 2. 새 비밀번호 확인
@@ -159,11 +159,11 @@ class UserService:
             raise bad_request_error(ErrorCode.PASSWORD_MISMATCH, timestamp)
 
         # 3. 새 비밀번호가 현재 비밀번호와 같은지 확인 (재사용 방지)
-        if await asyncio.to_thread(verify_password, new_password, stored_password_hash):
+        if await verify_password_async(new_password, stored_password_hash):
             raise bad_request_error(ErrorCode.SAME_PASSWORD, timestamp)
 
         # 4. 해싱 및 업데이트
-        hashed_new_password = await asyncio.to_thread(hash_password, new_password)
+        hashed_new_password = await hash_password_async(new_password)
         await user_models.update_password(user_id, hashed_new_password)
 
     @staticmethod
@@ -179,8 +179,10 @@ class UserService:
             raise bad_request_error(ErrorCode.INACTIVE_USER, timestamp)
 
         # 2. 비밀번호 확인 (소셜 전용 계정은 비밀번호 검증 생략)
-        if current_user.password is not None and (
-            not password or not await asyncio.to_thread(verify_password, password, current_user.password)
+        # current_user(ID 기반 조회/캐시)에는 해시가 없으므로 DB에서 직접 조회
+        stored_password_hash = await user_models.get_password_hash(user_id)
+        if stored_password_hash is not None and (
+            not password or not await verify_password_async(password, stored_password_hash)
         ):
             raise bad_request_error(ErrorCode.INVALID_PASSWORD, timestamp)
 
@@ -242,7 +244,7 @@ class UserService:
 
         if not user:
             # 타이밍 공격 방지: 실제 bcrypt와 동일한 연산 수행
-            await asyncio.to_thread(hash_password, "dummy_password_for_timing")
+            await hash_password_async("dummy_password_for_timing")
             return
 
         temp_pw = generate_temp_password()
@@ -263,5 +265,5 @@ class UserService:
         )
 
         # 이메일 발송 성공 후에만 비밀번호 업데이트
-        hashed = await asyncio.to_thread(hash_password, temp_pw)
+        hashed = await hash_password_async(temp_pw)
         await user_models.update_password(user.id, hashed)
@@ -212,10 +212,10 @@ async def save_wiki_page_tags(wiki_page_id: int, tag_ids: list[int]) -> None:
     """위키 페이지의 태그를 교체합니다."""
     async with transactional() as cur:
         await cur.execute("DELETE FROM wiki_page_tag WHERE wiki_page_id = %s", (wiki_page_id,))
-        for tag_id in tag_ids:
-            await cur.execute(
+        if tag_ids:
+            await cur.executemany(
                 "INSERT IGNORE INTO wiki_page_tag (wiki_page_id, tag_id) VALUES (%s, %s)",
-                (wiki_page_id, tag_id),
+                [(wiki_page_id, tag_id) for tag_id in tag_ids],
             )
 
 
@@ -234,7 +234,7 @@ async def get_popular_wiki_tags(limit: int = 10) -> list[dict]:
                 """,
             (limit,),
         )
-        return [dict(row) for row in await cur.fetchall()]
+        return list(await cur.fetchall())
 
 
 async def get_wiki_page_tags(wiki_page_id: int) -> list[dict]:
@@ -250,7 +250,7 @@ async def get_wiki_page_tags(wiki_page_id: int) -> list[dict]:
                 """,
             (wiki_page_id,),
         )
-        return [dict(row) for row in await cur.fetchall()]
+        return list(await cur.fetchall())
 
 
 async def get_wiki_pages_tags(wiki_page_ids: list[int]) -> dict[int, list[dict]]:
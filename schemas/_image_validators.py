@@ -7,9 +7,14 @@ S3 스토리지 사용 시 S3 버킷 URL도 허용합니다.
 
 import os
 
-_ALLOWED_IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
+# str.startswith/endswith에 그대로 넘기도록 튜플로 유지 — 검증마다 제너레이터를 만들지 않음
+_ALLOWED_IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".gif", ".webp")
+_ALLOWED_PROFILE_EXTENSIONS = (".jpg", ".jpeg", ".png")
 _ALLOWED_PROFILE_PREFIXES = ("/uploads/", "/assets/profiles/")
 
+# 가장 긴 허용 확장자(.jpeg, .webp) 길이 — 확장자 비교는 URL 끝 이만큼만 소문자로 변환
+_EXTENSION_TAIL = max(len(ext) for ext in _ALLOWED_IMAGE_EXTENSIONS)
+
 # S3 스토리지 사용 시 S3 URL 프리픽스도 허용
 _S3_BUCKET = os.getenv("S3_UPLOADS_BUCKET", "")
 _S3_REGION = os.getenv("S3_REGION", "ap-northeast-2")
@@ -22,6 +27,10 @@ if _S3_BUCKET:
         _s3_list.append(f"https://{_S3_CDN_DOMAIN}/")
     _S3_PREFIXES = tuple(_s3_list)
 
+# 허용 프리픽스 전체 — S3 설정은 프로세스 시작 시 고정되므로 모듈 로드 시 한 번만 조립
+_UPLOAD_URL_PREFIXES = ("/uploads/", *_S3_PREFIXES)
+_PROFILE_URL_PREFIXES = _ALLOWED_PROFILE_PREFIXES + _S3_PREFIXES
+
 
 def validate_upload_image_url(v: str | None) -> str | None:
     """업로드된 이미지 URL을 검증합니다 (게시글 이미지용).
@@ -32,10 +41,9 @@ def validate_upload_image_url(v: str | None) -> str | None:
         return None
     if ".." in v:
         raise ValueError("이미지 URL에 잘못된 경로 문자가 포함되어 있습니다.")
-    allowed = ("/uploads/", *_S3_PREFIXES)
-    if not any(v.startswith(prefix) for prefix in allowed):
+    if not v.startswith(_UPLOAD_URL_PREFIXES):
         raise ValueError("이미지 URL은 업로드된 파일 경로만 허용됩니다.")
-    if not any(v.lower().endswith(ext) for ext in _ALLOWED_IMAGE_EXTENSIONS):
+    if not v[-_EXTENSION_TAIL:].lower().endswith(_ALLOWED_IMAGE_EXTENSIONS):
         raise ValueError("이미지는 .jpg, .jpeg, .png, .gif, .webp 형식만 허용됩니다.")
     return v
 
@@ -69,10 +77,8 @@ def validate_profile_image_url(v: str | dict | None) -> str | None:
             return None
     if ".." in v:
         raise ValueError("프로필 이미지 URL에 잘못된 경로 문자가 포함되어 있습니다.")
-    allowed = _ALLOWED_PROFILE_PREFIXES + _S3_PREFIXES
-    if not any(v.startswith(prefix) for prefix in allowed):
+    if not v.startswith(_PROFILE_URL_PREFIXES):
         raise ValueError("프로필 이미지는 업로드된 파일 경로만 허용됩니다.")
-    allowed_extensions = {".jpg", ".jpeg", ".png"}
-    if not any(v.lower().endswith(ext) for ext in allowed_extensions):
+    if not v[-_EXTENSION_TAIL:].lower().endswith(_ALLOWED_PROFILE_EXTENSIONS):
         raise ValueError("프로필 이미지는 .jpg, .jpeg, .png 형식만 허용됩니다.")
     return v
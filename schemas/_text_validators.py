@@ -0,0 +1,26 @@
+"""텍스트 필드 검증 공통 헬퍼.
+
+게시글 제목/내용, 댓글 내용처럼 "앞뒤 공백 제거 후 최소 길이" 규칙을 공유하는 필드의
+AfterValidator 콜백을 생성합니다.
+"""
+
+from collections.abc import Callable
+
+
+def make_stripped_checker(label: str, min_length: int) -> Callable[[str], str]:
+    """공백 제거 후 min_length자 이상인지 검증하는 AfterValidator 콜백을 생성하는 팩토리.
+
+    Args:
+        label: 에러 메시지에 쓰는 필드 이름 (예: "제목").
+        min_length: 공백 제거 후 최소 길이.
+    """
+    error_msg = f"{label}은 최소 {min_length}자 이상이어야 합니다."
+
+    def _checker(v: str) -> str:
+        v = v.strip()
+        if len(v) < min_length:
+            raise ValueError(error_msg)
+        return v
+
+    _checker.__qualname__ = f"_check_stripped_{min_length}"
+    return _checker
@@ -3,9 +3,10 @@
 API 응답 생성 및 공통 데이터 변환 함수를 정의합니다.
 """
 
-from datetime import UTC, datetime
 from typing import Any
 
+from core.utils.clock import utc_timestamp
+
 
 def create_response(
     code: str,
@@ -29,7 +30,7 @@ def create_response(
         "message": message,
         "data": data if data is not None else {},
         "errors": [],
-        "timestamp": timestamp or datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "timestamp": timestamp or utc_timestamp(),
     }
 
 
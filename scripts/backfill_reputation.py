@@ -186,10 +186,7 @@ async def recompute_trust_levels() -> None:
 async def evaluate_badges() -> None:
     """모든 사용자에 대해 배지 조건을 평가합니다."""
     from modules.reputation.service import ReputationService
-
-    async with get_cursor() as cur:
-        await cur.execute("SELECT id FROM user WHERE deleted_at IS NULL")
-        users = await cur.fetchall()
+    from modules.user.models import iter_active_user_ids
 
     badge_event_types = [
         "post_created",
@@ -203,13 +200,16 @@ async def evaluate_badges() -> None:
         "reputation_changed",
     ]
 
-    for i, u in enumerate(users):
+    # 전체 사용자 ID를 한 번에 올리지 않고 배치 단위로 순회
+    evaluated = 0
+    async for user_id in iter_active_user_ids():
         for event_type in badge_event_types:
-            await ReputationService._check_badges(u["id"], event_type, None, None)
-        if (i + 1) % 100 == 0:
-            logger.info("  %d/%d 사용자 배지 평가 완료", i + 1, len(users))
+            await ReputationService._check_badges(user_id, event_type, None, None)
+        evaluated += 1
+        if evaluated % 100 == 0:
+            logger.info("  %d명 배지 평가 완료", evaluated)
 
-    logger.info("배지 평가 완료 (총 %d명)", len(users))
+    logger.info("배지 평가 완료 (총 %d명)", evaluated)
 
 
 async def main() -> None:
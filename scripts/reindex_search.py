@@ -0,0 +1,62 @@
+"""외부 검색 엔진(Meilisearch) 게시글 재색인 스크립트.
+
+SEARCH_BACKEND=meilisearch 도입 전 게시글의 백필, 또는 검색 엔진 장애로 빠진 색인 복구에 사용합니다.
+삭제되지 않은 게시글을 id 순으로 배치 조회해 색인에 upsert합니다 (여러 번 실행해도 안전).
+삭제된 게시글의 남은 문서는 목록 조회 시 MySQL이 걸러내므로 따로 지우지 않습니다.
+
+사용법: cd 2-cho-community-be && uv run python scripts/reindex_search.py
+"""
+
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.database.connection import close_db, get_cursor, init_db
+from core.utils import search_index
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 1000
+
+
+async def reindex_posts() -> int:
+    """삭제되지 않은 게시글 전체를 배치 단위로 색인합니다."""
+    total = 0
+    last_id = 0
+    while True:
+        async with get_cursor() as cur:
+            await cur.execute(
+                "SELECT id, title, content FROM post WHERE deleted_at IS NULL AND id > %s ORDER BY id LIMIT %s",
+                (last_id, BATCH_SIZE),
+            )
+            rows = await cur.fetchall()
+        if not rows:
+            break
+        await search_index.index_posts([{"id": r["id"], "title": r["title"], "content": r["content"]} for r in rows])
+        last_id = rows[-1]["id"]
+        total += len(rows)
+        logger.info("  %d건 색인 (누적 %d, 마지막 id=%d)", len(rows), total, last_id)
+    return total
+
+
+async def main() -> None:
+    """삭제되지 않은 게시글 전체를 재색인합니다."""
+    if not search_index.is_enabled():
+        logger.error("SEARCH_BACKEND=meilisearch와 MEILISEARCH_URL 설정이 필요합니다.")
+        sys.exit(1)
+
+    await init_db()
+    try:
+        total = await reindex_posts()
+        logger.info("재색인 완료: 게시글 %d건", total)
+    finally:
+        await search_index.close_search_index()
+        await close_db()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -17,6 +17,19 @@ async def test_get_eligible_users(client, fake, db):
     assert user["user_id"] in user_ids
 
 
+@pytest.mark.asyncio
+async def test_iter_eligible_users_matches_list(client, fake, db):
+    """배치 순회 결과는 일괄 조회와 같은 사용자를 id 순으로 반환."""
+    from modules.notification.digest_models import get_eligible_users, iter_eligible_users
+
+    for _ in range(3):
+        await create_verified_user(client, fake)
+
+    expected = sorted(u["id"] for u in await get_eligible_users("weekly", lookback_days=7))
+    streamed = [u["id"] async for u in iter_eligible_users("weekly", lookback_days=7, batch_size=2)]
+    assert streamed == expected
+
+
 @pytest.mark.asyncio
 async def test_active_user_excluded(client, fake, db):
     """활성 사용자는 제외."""
@@ -46,6 +46,40 @@ async def test_list_posts_pagination(client: AsyncClient, fake):
     assert len(res2.json()["data"]["posts"]) == 1
 
 
+@pytest.mark.asyncio
+async def test_list_posts_cursor_pagination(client: AsyncClient, fake):
+    """next_cursor로 다음 페이지를 중복/누락 없이 조회한다."""
+    user = await create_verified_user(client, fake)
+    for i in range(5):
+        await create_test_post(client, user["headers"], title=f"커서 테스트 {i}")
+
+    seen: list[int] = []
+    res = await client.get("/v1/posts/?limit=2")
+    assert res.status_code == 200
+    data = res.json()["data"]
+    seen.extend(p["post_id"] for p in data["posts"])
+    cursor = data["pagination"]["next_cursor"]
+
+    while cursor:
+        res = await client.get(f"/v1/posts/?limit=2&cursor={cursor}")
+        assert res.status_code == 200
+        data = res.json()["data"]
+        seen.extend(p["post_id"] for p in data["posts"])
+        cursor = data["pagination"]["next_cursor"]
+        if not data["pagination"]["has_more"]:
+            assert cursor is None
+
+    assert len(seen) == 5
+    assert len(set(seen)) == 5
+
+
+@pytest.mark.asyncio
+async def test_list_posts_invalid_cursor_returns_400(client: AsyncClient):
+    """형식이 잘못된 커서는 400을 반환한다."""
+    res = await client.get("/v1/posts/?cursor=not-a-cursor")
+    assert res.status_code == 400
+
+
 # ---------------------------------------------------------------------------
 # 카테고리/태그 필터
 # ---------------------------------------------------------------------------
@@ -0,0 +1,53 @@
+# tests/test_body_limit.py
+import pytest
+from fastapi import FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+
+from core.middleware.body_limit import BodyLimitMiddleware
+
+_LIMIT = 1024
+
+
+def _make_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(BodyLimitMiddleware, max_body_size=_LIMIT)
+
+    @app.post("/echo")
+    async def echo(request: Request) -> dict:
+        return {"size": len(await request.body())}
+
+    return app
+
+
+async def _chunks(total: int, chunk_size: int = 256):
+    for _ in range(total // chunk_size):
+        yield b"x" * chunk_size
+
+
+@pytest.mark.asyncio
+async def test_content_length_within_limit_passes():
+    """제한 이하 본문은 그대로 전달된다."""
+    async with AsyncClient(transport=ASGITransport(app=_make_app()), base_url="http://test") as client:
+        response = await client.post("/echo", content=b"x" * _LIMIT)
+    assert response.status_code == 200
+    assert response.json() == {"size": _LIMIT}
+
+
+@pytest.mark.asyncio
+async def test_content_length_over_limit_rejected():
+    """Content-Length가 제한을 넘으면 413을 반환한다."""
+    async with AsyncClient(transport=ASGITransport(app=_make_app()), base_url="http://test") as client:
+        response = await client.post("/echo", content=b"x" * (_LIMIT + 1))
+    assert response.status_code == 413
+    assert response.json()["detail"]["code"] == "PAYLOAD_TOO_LARGE"
+
+
+@pytest.mark.asyncio
+async def test_chunked_body_over_limit_rejected():
+    """Content-Length 없는 스트리밍 본문도 수신 바이트가 제한을 넘으면 413을 반환한다."""
+    async with AsyncClient(transport=ASGITransport(app=_make_app()), base_url="http://test") as client:
+        small = await client.post("/echo", content=_chunks(_LIMIT))
+        large = await client.post("/echo", content=_chunks(_LIMIT * 4))
+    assert small.status_code == 200
+    assert large.status_code == 413
+    assert large.json()["detail"]["code"] == "PAYLOAD_TOO_LARGE"
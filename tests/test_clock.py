@@ -0,0 +1,28 @@
+# tests/test_clock.py
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+from core.utils import clock
+
+
+def test_utc_timestamp_formats_utc_seconds():
+    """현재 초를 UTC 기준 ISO 8601 문자열로 반환한다."""
+    with patch("core.utils.clock.time.time", return_value=1_767_225_600.9):
+        assert clock.utc_timestamp() == "2026-01-01T00:00:00Z"
+
+
+def test_utc_timestamp_reuses_string_within_second():
+    """같은 초 안에서는 같은 문자열 객체를 재사용하고, 초가 바뀌면 갱신한다."""
+    with patch("core.utils.clock.time.time", return_value=1_767_225_601.1):
+        first = clock.utc_timestamp()
+    with patch("core.utils.clock.time.time", return_value=1_767_225_601.8):
+        assert clock.utc_timestamp() is first
+    with patch("core.utils.clock.time.time", return_value=1_767_225_602.0):
+        assert clock.utc_timestamp() == "2026-01-01T00:00:02Z"
+
+
+def test_utc_timestamp_matches_datetime_format():
+    """기존 datetime.now(UTC).strftime 형식과 같은 문자열을 만든다."""
+    expected = datetime.fromtimestamp(1_767_225_603, UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+    with patch("core.utils.clock.time.time", return_value=1_767_225_603.0):
+        assert clock.utc_timestamp() == expected
@@ -0,0 +1,112 @@
+# tests/test_db_connection.py
+import asyncio
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import aiomysql
+import pytest
+
+from core.database import connection
+
+
+class _FakePool:
+    """크기가 제한된 가짜 연결 풀 — 빈 연결이 없으면 반환될 때까지 대기한다."""
+
+    def __init__(self, size: int = 10):
+        self.size = size
+        self.acquired = 0
+        self.released: list = []
+        self.in_use = 0
+        self.max_in_use = 0
+        self.cursors: list = []
+        self._slots = asyncio.Semaphore(size)
+
+    def acquire(self):
+        pool = self
+
+        class _Acquire:
+            async def __aenter__(self):
+                await pool._slots.acquire()
+                pool.acquired += 1
+                pool.in_use += 1
+                pool.max_in_use = max(pool.max_in_use, pool.in_use)
+                self.conn = SimpleNamespace(closed=False, echo=False, cursor=pool._open_cursor)
+                return self.conn
+
+            async def __aexit__(self, *exc):
+                pool.in_use -= 1
+                pool.released.append(self.conn)
+                pool._slots.release()
+
+        return _Acquire()
+
+    async def _open_cursor(self, cursor_class):
+        async def close():
+            cur.closed = True
+
+        cur = SimpleNamespace(cursor_class=cursor_class, closed=False, close=close)
+        self.cursors.append(cur)
+        return cur
+
+
+@pytest.fixture
+def fake_pool():
+    pool = _FakePool(size=2)
+    with patch.object(connection, "_pool", pool):
+        yield pool
+
+
+@pytest.mark.asyncio
+async def test_acquires_and_releases_per_call(fake_pool):
+    """get_cursor는 호출마다 풀에서 획득하고 블록이 끝나면 바로 반환한다."""
+    async with connection.get_cursor():
+        assert fake_pool.in_use == 1
+    async with connection.get_cursor(as_tuple=True):
+        pass
+
+    assert fake_pool.acquired == 2
+    assert len(fake_pool.released) == 2
+    assert fake_pool.in_use == 0
+
+
+@pytest.mark.asyncio
+async def test_opens_and_closes_cursor_per_call(fake_pool):
+    """커서는 획득마다 conn.cursor()로 새로 열고, 연결을 반환하기 전에 닫는다."""
+    async with connection.get_cursor():
+        assert not fake_pool.cursors[0].closed
+    async with connection.get_cursor(as_tuple=True):
+        pass
+
+    assert [cur.cursor_class for cur in fake_pool.cursors] == [aiomysql.DictCursor, aiomysql.Cursor]
+    assert all(cur.closed for cur in fake_pool.cursors)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_do_not_exhaust_pool(fake_pool):
+    """풀 크기만큼의 요청이 각자 gather로 쿼리를 동시에 실행해도 교착 없이 끝난다."""
+
+    async def query():
+        async with connection.get_cursor():
+            await asyncio.sleep(0)
+
+    async def request():
+        await query()
+        await asyncio.gather(query(), query())
+        await query()
+
+    await asyncio.wait_for(asyncio.gather(*(request() for _ in range(fake_pool.size))), timeout=1)
+
+    assert fake_pool.max_in_use <= fake_pool.size
+    assert fake_pool.in_use == 0
+    assert fake_pool.acquired == len(fake_pool.released) == fake_pool.size * 4
+
+
+def test_db_timestamp_follows_server_session_offset():
+    """db_timestamp는 세션 시간대를 바꾸지 않고, 측정한 서버 오프셋을 더한 naive 초 단위 값을 반환한다."""
+    now = datetime(2026, 1, 1, 12, 0, 0, 500_000, tzinfo=UTC)
+    with (
+        patch.object(connection, "utc_now", return_value=now),
+        patch.object(connection, "_db_utc_offset", timedelta(hours=9)),
+    ):
+        assert connection.db_timestamp() == datetime(2026, 1, 1, 21, 0, 0)
@@ -0,0 +1,33 @@
+# tests/test_image_validators.py
+import pytest
+
+from schemas._image_validators import validate_profile_image_url, validate_upload_image_url
+
+
+def test_upload_image_url_accepts_upload_path_case_insensitive():
+    """업로드 경로 + 허용 확장자는 대소문자와 무관하게 통과한다."""
+    assert validate_upload_image_url("/uploads/a/b.PNG") == "/uploads/a/b.PNG"
+    assert validate_upload_image_url(None) is None
+
+
+@pytest.mark.parametrize(
+    "url",
+    ["https://evil.example/a.png", "/uploads/a.svg", "/uploads/../secret.png", "/assets/profiles/a.png"],
+)
+def test_upload_image_url_rejects(url):
+    """외부 URL, 허용되지 않은 확장자, 경로 조작, 프로필 전용 경로는 거부한다."""
+    with pytest.raises(ValueError):
+        validate_upload_image_url(url)
+
+
+def test_profile_image_url_accepts_dict_and_default_profile():
+    """dict 입력은 url 키를 꺼내 검증하고, 기본 프로필 경로를 허용한다."""
+    assert validate_profile_image_url({"url": "/uploads/p.jpeg"}) == "/uploads/p.jpeg"
+    assert validate_profile_image_url("/assets/profiles/default_profile.jpg") == "/assets/profiles/default_profile.jpg"
+
+
+@pytest.mark.parametrize("url", ["/uploads/p.gif", "/static/p.png"])
+def test_profile_image_url_rejects(url):
+    """프로필 이미지는 .jpg/.jpeg/.png와 허용 프리픽스만 통과한다."""
+    with pytest.raises(ValueError):
+        validate_profile_image_url(url)
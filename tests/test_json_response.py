@@ -0,0 +1,26 @@
+# tests/test_json_response.py
+import json
+
+from core.utils.json_response import FastJSONResponse
+
+
+def _stdlib_body(content) -> bytes:
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def test_render_matches_stdlib_json():
+    """표준 JSONResponse와 같은 바이트를 만든다 (UTF-8, 공백 없음)."""
+    content = {
+        "code": "SUCCESS",
+        "message": "조회 성공",
+        "data": {"posts": [{"post_id": 1, "title": "제목", "likes": 2.5, "tags": [], "author": None}]},
+        "errors": [],
+        "timestamp": "2026-01-01T00:00:00Z",
+    }
+
+    assert FastJSONResponse(content).body == _stdlib_body(content)
+
+
+def test_render_nan_as_null():
+    """NaN/Infinity는 표준 JSON에 없으므로 null로 직렬화한다."""
+    assert FastJSONResponse({"score": float("nan"), "rank": float("inf")}).body == b'{"score":null,"rank":null}'
@@ -0,0 +1,92 @@
+# tests/test_like_bitmap.py
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from core.config import settings
+from core.utils import like_bitmap
+
+
+@pytest.fixture
+def bitmap_enabled(monkeypatch):
+    monkeypatch.setattr(settings, "LIKE_CACHE_BACKEND", "redis")
+    monkeypatch.setattr(settings, "REDIS_URL", "redis://localhost:6379")
+
+
+def _patch_redis(mock_redis):
+    return patch("core.utils.like_bitmap._redis", AsyncMock(return_value=mock_redis))
+
+
+@pytest.mark.asyncio
+async def test_bitmap_disabled_by_default():
+    """기본 설정(none)에서는 None을 반환하여 MySQL로 조회한다."""
+    assert like_bitmap.is_enabled() is False
+    assert await like_bitmap.is_liked(1, 2) is None
+    assert await like_bitmap.claim_warmup(1) is None
+
+
+@pytest.mark.asyncio
+async def test_is_liked_reads_bit(bitmap_enabled):
+    """적재된 비트맵에서 좋아요 비트를 읽는다."""
+    mock_redis = AsyncMock()
+    mock_redis.eval.return_value = 1
+
+    with _patch_redis(mock_redis):
+        assert await like_bitmap.is_liked(10, 42) is True
+
+    args = mock_redis.eval.call_args.args
+    assert args[1:] == (1, "post:likers:10", 42)
+
+
+@pytest.mark.asyncio
+async def test_is_liked_cold_bitmap_returns_none(bitmap_enabled):
+    """적재 표식이 없으면 None을 반환한다 (MySQL 폴백)."""
+    mock_redis = AsyncMock()
+    mock_redis.eval.return_value = -1
+
+    with _patch_redis(mock_redis):
+        assert await like_bitmap.is_liked(10, 42) is None
+
+
+@pytest.mark.asyncio
+async def test_redis_failure_does_not_raise(bitmap_enabled):
+    """Redis 장애 시 조회는 None, 갱신은 예외를 전파하지 않는다."""
+    mock_redis = AsyncMock()
+    mock_redis.eval.side_effect = ConnectionError("Redis down")
+    mock_redis.set.side_effect = ConnectionError("Redis down")
+
+    with _patch_redis(mock_redis):
+        assert await like_bitmap.is_liked(10, 42) is None
+        await like_bitmap.mark(10, 42, liked=True)
+        assert await like_bitmap.claim_warmup(10) is None
+
+
+@pytest.mark.asyncio
+async def test_claim_warmup_returns_version(bitmap_enabled):
+    """적재 락을 얻으면 그 시점의 버전을, 얻지 못하면 None을 반환한다."""
+    mock_redis = AsyncMock()
+    mock_redis.eval.side_effect = [3, -1]
+
+    with _patch_redis(mock_redis):
+        assert await like_bitmap.claim_warmup(10) == 3
+        assert await like_bitmap.claim_warmup(10) is None
+
+    args = mock_redis.eval.call_args.args
+    assert args[1:4] == (2, "post:likers:10:warming", "post:likers:10:version")
+
+
+@pytest.mark.asyncio
+async def test_mark_and_warm_share_version_key(bitmap_enabled):
+    """mark는 버전 키를 올리고, warm은 claim 시점 버전과 함께 적재를 요청한다 (버전이 바뀌면 스크립트가 적재 포기)."""
+    mock_redis = AsyncMock()
+
+    with _patch_redis(mock_redis):
+        await like_bitmap.mark(10, 42, liked=False)
+        await like_bitmap.warm(10, [7, 42], version=3)
+
+    mark_call, warm_call = mock_redis.eval.call_args_list
+    assert "INCR" in mark_call.args[0]
+    assert mark_call.args[1:6] == (2, "post:likers:10", "post:likers:10:version", 42, 0)
+    assert warm_call.args[1:5] == (3, "post:likers:10", "post:likers:10:version", "post:likers:10:warming")
+    assert warm_call.args[5] == 3
+    assert warm_call.args[7:] == (7, 42)
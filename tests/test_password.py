@@ -0,0 +1,14 @@
+# tests/test_password.py
+import pytest
+
+from core.utils.password import hash_password_async, verify_password_async
+
+
+@pytest.mark.asyncio
+async def test_password_async_round_trip():
+    """전용 스레드 풀에서 해싱한 비밀번호를 검증한다."""
+    hashed = await hash_password_async("Test1234!")
+
+    assert await verify_password_async("Test1234!", hashed) is True
+    assert await verify_password_async("wrong", hashed) is False
+    assert await verify_password_async("Test1234!", "not-a-hash") is False
@@ -0,0 +1,129 @@
+# tests/test_search_index.py
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from core.config import settings
+from core.utils import search_index
+
+
+@pytest.fixture
+async def meilisearch_enabled(monkeypatch):
+    monkeypatch.setattr(settings, "SEARCH_BACKEND", "meilisearch")
+    monkeypatch.setattr(settings, "MEILISEARCH_URL", "http://search.test")
+    monkeypatch.setattr(settings, "MEILISEARCH_API_KEY", "test-key")
+    yield
+    await search_index.close_search_index()
+
+
+def _mock_client(handler):
+    real_client = httpx.AsyncClient
+
+    def factory(**kwargs):
+        return real_client(transport=httpx.MockTransport(handler), **kwargs)
+
+    return patch("core.utils.search_index.httpx.AsyncClient", side_effect=factory)
+
+
+@pytest.mark.asyncio
+async def test_search_disabled_by_default():
+    """기본 설정(mysql)에서는 None을 반환하여 FULLTEXT를 사용한다."""
+    assert search_index.is_enabled() is False
+    assert await search_index.search_post_ids("리눅스") is None
+
+
+@pytest.mark.asyncio
+async def test_search_returns_hit_ids(meilisearch_enabled):
+    """검색 결과 hits의 id를 순서대로 반환한다."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"hits": [{"id": 3}, {"id": 1}]})
+
+    with _mock_client(handler):
+        ids = await search_index.search_post_ids("커널")
+
+    assert ids == [3, 1]
+    assert requests[0].url.path == "/indexes/posts/search"
+    assert requests[0].headers["Authorization"] == "Bearer test-key"
+
+
+@pytest.mark.asyncio
+async def test_search_failure_falls_back(meilisearch_enabled):
+    """검색 엔진 오류 시 None을 반환한다 (MySQL 폴백)."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(503)
+
+    with _mock_client(handler):
+        assert await search_index.search_post_ids("커널") is None
+
+
+@pytest.mark.asyncio
+async def test_search_at_hit_cap_falls_back(meilisearch_enabled):
+    """매칭이 MAX_SEARCH_HITS에 닿으면 총 개수/페이지가 잘리지 않도록 None을 반환한다 (MySQL 폴백)."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        hits = [{"id": i} for i in range(search_index.MAX_SEARCH_HITS)]
+        return httpx.Response(200, json={"hits": hits, "estimatedTotalHits": 5000})
+
+    with _mock_client(handler):
+        assert await search_index.search_post_ids("리눅스") is None
+
+
+@pytest.mark.asyncio
+async def test_index_failure_does_not_raise(meilisearch_enabled):
+    """색인 실패는 best-effort로 예외를 전파하지 않는다."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("down")
+
+    with _mock_client(handler):
+        await search_index.index_post(1, "제목", "내용")
+        await search_index.remove_post(1)
+
+
+@pytest.mark.asyncio
+async def test_enqueued_writes_run_in_order_on_shared_client(meilisearch_enabled):
+    """요청 경로의 색인 쓰기는 기다리지 않고, 워커가 하나의 클라이언트로 순서대로 전송한다."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(202, json={})
+
+    with _mock_client(handler) as client_factory:
+        await search_index.init_search_index()
+        search_index.enqueue_index_post(1, "제목", "내용")
+        search_index.enqueue_index_post(1, "수정", "내용")
+        search_index.enqueue_remove_post(1)
+        assert requests == []
+
+        await search_index.close_search_index()
+
+    assert [(r.method, r.url.path) for r in requests] == [
+        ("POST", "/indexes/posts/documents"),
+        ("POST", "/indexes/posts/documents"),
+        ("DELETE", "/indexes/posts/documents/1"),
+    ]
+    assert json.loads(requests[1].content) == [{"id": 1, "title": "수정", "content": "내용"}]
+    assert client_factory.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_close_waits_for_cancelled_writer(meilisearch_enabled):
+    """종료 시 워커 취소가 끝난 뒤에 HTTP 클라이언트를 닫는다."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(202, json={})
+
+    with _mock_client(handler):
+        await search_index.init_search_index()
+        writer = search_index._writer
+        await search_index.close_search_index()
+
+    assert writer is not None
+    assert writer.cancelled()
@@ -0,0 +1,114 @@
+# tests/test_user_cache.py
+import asyncio
+from dataclasses import replace
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from core.config import settings
+from modules.user import cache as user_cache
+from modules.user.models import User
+
+
+@pytest.fixture
+def cache_enabled(monkeypatch):
+    monkeypatch.setattr(settings, "USER_CACHE_BACKEND", "redis")
+    monkeypatch.setattr(settings, "REDIS_URL", "redis://localhost:6379")
+
+
+def _user(user_id: int = 1, password: str | None = "hashed") -> User:
+    return User(
+        id=user_id,
+        email=f"user{user_id}@example.com",
+        password=password,
+        nickname=f"user{user_id}",
+        email_verified=True,
+        suspended_until=datetime(2026, 1, 2, 3, 4, 5),
+        created_at=datetime(2025, 1, 1),
+    )
+
+
+def test_dump_load_round_trip():
+    """직렬화 후 복원한 사용자는 비밀번호 해시를 제외하고 원본과 같다 (datetime 포함)."""
+    user = _user()
+    raw = user_cache._dump(user)
+
+    assert "hashed" not in raw
+    assert user_cache._load(raw) == replace(user, password=None)
+
+
+@pytest.mark.asyncio
+async def test_cache_disabled_by_default():
+    """기본 설정(none)에서는 Redis를 사용하지 않는다."""
+    assert user_cache.is_enabled() is False
+    assert await user_cache.get_many([1]) == {}
+
+
+@pytest.mark.asyncio
+async def test_get_many_returns_hits_only(cache_enabled):
+    """캐시에 있는 사용자만 반환한다."""
+    mock_redis = AsyncMock()
+    mock_redis.mget.return_value = [user_cache._dump(_user(1)), None]
+
+    with patch("modules.user.cache._redis", AsyncMock(return_value=mock_redis)):
+        users = await user_cache.get_many([1, 2])
+
+    assert users == {1: _user(1, password=None)}
+    mock_redis.mget.assert_awaited_once_with(["user:1", "user:2"])
+
+
+@pytest.mark.asyncio
+async def test_redis_failure_falls_back(cache_enabled):
+    """Redis 장애 시 빈 결과를 반환하고 무효화는 예외를 전파하지 않는다."""
+    mock_redis = AsyncMock()
+    mock_redis.mget.side_effect = ConnectionError("Redis down")
+    mock_redis.delete.side_effect = ConnectionError("Redis down")
+
+    with patch("modules.user.cache._redis", AsyncMock(return_value=mock_redis)):
+        assert await user_cache.get_many([1]) == {}
+        await user_cache.invalidate(1)
+
+
+@pytest.mark.asyncio
+async def test_load_once_coalesces_concurrent_loads():
+    """같은 ID의 동시 조회는 load()를 한 번만 호출하고 결과를 공유한다."""
+    calls = 0
+    release = asyncio.Event()
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return _user()
+
+    waiters = [asyncio.create_task(user_cache.load_once(1, load)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*waiters) == [_user()] * 3
+    assert calls == 1
+    assert user_cache._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_invalidate_drops_inflight_load():
+    """무효화 이후의 조회는 무효화 이전에 시작된 조회를 공유하지 않는다."""
+    release = asyncio.Event()
+    calls = 0
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return _user()
+
+    first = asyncio.create_task(user_cache.load_once(1, load))
+    await asyncio.sleep(0)
+    await user_cache.invalidate(1)
+    second = asyncio.create_task(user_cache.load_once(1, load))
+    await asyncio.sleep(0)
+    release.set()
+
+    await asyncio.gather(first, second)
+    assert calls == 2
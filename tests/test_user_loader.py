@@ -0,0 +1,58 @@
+# tests/test_user_loader.py
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from modules.user.loader import UserLoader
+
+
+@pytest.mark.asyncio
+async def test_loads_in_same_tick_are_batched():
+    """같은 틱의 load() 호출은 한 번의 IN 쿼리로 모인다."""
+    batch = AsyncMock(return_value={1: "user-1", 3: "user-3"})
+
+    with patch("modules.user.loader.get_users_by_ids", batch):
+        loader = UserLoader()
+        results = await asyncio.gather(loader.load(1), loader.load(2), loader.load(3), loader.load(1))
+
+    assert results == ["user-1", None, "user-3", "user-1"]
+    batch.assert_awaited_once_with([1, 2, 3])
+
+
+@pytest.mark.asyncio
+async def test_repeated_load_reuses_result():
+    """이미 조회한 ID는 다시 조회하지 않는다."""
+    batch = AsyncMock(return_value={7: "user-7"})
+
+    with patch("modules.user.loader.get_users_by_ids", batch):
+        loader = UserLoader()
+        assert await loader.load(7) == "user-7"
+        assert await loader.load(7) == "user-7"
+
+    batch.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_batches_split_by_max_size():
+    """max_batch_size를 넘는 ID는 여러 쿼리로 나뉜다."""
+    batch = AsyncMock(side_effect=lambda ids: {i: f"user-{i}" for i in ids})
+
+    with patch("modules.user.loader.get_users_by_ids", batch):
+        loader = UserLoader(max_batch_size=2)
+        results = await loader.load_many([1, 2, 3])
+
+    assert results == ["user-1", "user-2", "user-3"]
+    assert batch.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_propagates_and_allows_retry():
+    """조회 실패는 호출자에게 전파되고, 이후 재조회가 가능하다."""
+    batch = AsyncMock(side_effect=[RuntimeError("db down"), {5: "user-5"}])
+
+    with patch("modules.user.loader.get_users_by_ids", batch):
+        loader = UserLoader()
+        with pytest.raises(RuntimeError):
+            await loader.load(5)
+        assert await loader.load(5) == "user-5"
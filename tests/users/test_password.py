@@ -3,6 +3,8 @@
 import pytest
 from httpx import AsyncClient
 
+from core.utils.password import verify_password
+from modules.user import models as user_models
 from tests.conftest import create_verified_user
 
 # ---------------------------------------------------------------------------
@@ -81,3 +83,25 @@ async def test_change_password_invalid_new_returns_422(client: AsyncClient, fake
 
     # Assert — Pydantic 유효성 검증 실패
     assert res.status_code == 422
+
+
+# ---------------------------------------------------------------------------
+# 비밀번호 해시 조회
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_user_by_id_omits_password_hash(client: AsyncClient, fake):
+    """ID 기반 조회(캐시 경로)는 해시를 싣지 않고, get_password_hash로만 조회된다."""
+    # Arrange
+    user = await create_verified_user(client, fake)
+
+    # Act
+    loaded = await user_models.get_user_by_id(user["user_id"])
+    stored_hash = await user_models.get_password_hash(user["user_id"])
+
+    # Assert
+    assert loaded is not None
+    assert loaded.password is None
+    assert stored_hash is not None
+    assert verify_password(user["payload"]["password"], stored_hash)
@@ -78,3 +78,19 @@ async def test_search_users_for_mention(client: AsyncClient, fake):
     assert "user_id" in first
     assert "nickname" in first
     assert "profileImageUrl" in first
+
+
+@pytest.mark.asyncio
+async def test_get_nicknames_by_ids(client: AsyncClient, fake):
+    """ID 목록으로 닉네임을 일괄 조회하고, 없는 ID는 결과에서 제외한다."""
+    from modules.user.models import get_nicknames_by_ids
+
+    # Arrange
+    first = await create_verified_user(client, fake, nickname="nickbulk1")
+    second = await create_verified_user(client, fake, nickname="nickbulk2")
+
+    # Act
+    nicknames = await get_nicknames_by_ids([first["user_id"], second["user_id"], 999_999_999])
+
+    # Assert
+    assert nicknames == {first["user_id"]: "nickbulk1", second["user_id"]: "nickbulk2"}
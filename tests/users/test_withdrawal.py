@@ -89,3 +89,48 @@ async def test_get_profile_after_withdrawal_returns_404(client: AsyncClient, fak
 
     # Assert — soft delete된 사용자는 조회 불가
     assert res.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_iter_active_user_ids_excludes_withdrawn(client: AsyncClient, fake):
+    """활성 사용자 배치 순회는 id 순으로 반환하고 탈퇴한 사용자를 제외한다."""
+    from modules.user.models import iter_active_user_ids, withdraw_user
+
+    # Arrange
+    users = [await create_verified_user(client, fake) for _ in range(3)]
+    await withdraw_user(users[1]["user_id"])
+
+    # Act — 배치 경계를 넘도록 작은 배치 크기로 순회
+    user_ids = [user_id async for user_id in iter_active_user_ids(batch_size=2)]
+
+    # Assert
+    assert user_ids == sorted(user_ids)
+    assert users[0]["user_id"] in user_ids
+    assert users[2]["user_id"] in user_ids
+    assert users[1]["user_id"] not in user_ids
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reregistration_over_zombie_user_claims_email_once(client: AsyncClient, fake):
+    """탈퇴했지만 이메일이 남은 사용자(Zombie)의 이메일로 동시에 가입하면 한 요청만 성공한다."""
+    import asyncio
+
+    from pymysql.err import IntegrityError
+
+    from core.database.connection import get_connection
+    from modules.user.models import register_user
+
+    # Arrange — 익명화 없이 soft delete만 된 레거시 탈퇴 사용자
+    user = await create_verified_user(client, fake)
+    async with get_connection() as conn, conn.cursor() as cur:
+        await cur.execute("UPDATE user SET deleted_at = NOW() WHERE id = %s", (user["user_id"],))
+
+    # Act — 같은 이메일, 서로 다른 닉네임으로 동시 재가입
+    results = await asyncio.gather(
+        *(register_user(user["email"], "hashed", f"{fake.lexify(text='?????')}{i}") for i in range(2)),
+        return_exceptions=True,
+    )
+
+    # Assert
+    assert sum(not isinstance(result, BaseException) for result in results) == 1
+    assert sum(isinstance(result, IntegrityError) for result in results) == 1